@@ -0,0 +1,119 @@
+"""Run the benchmark suite and write the results as JSON.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare baseline.json --threshold 0.2
+
+With --compare the command exits with status 1 when any benchmark is slower
+than the baseline by more than the threshold (a fraction, 0.2 means 20%)."""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    import django
+
+    django.setup()
+
+
+def get_environment():
+    import babel
+    import django
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "django": django.get_version(),
+        "babel": babel.__version__,
+    }
+
+
+def time_callable(func, repeat=5, number=None):
+    timer = timeit.Timer(func)
+    if number is None:
+        # Calibrate to roughly 0.2 seconds per repetition
+        number, _ = timer.autorange()
+    timings = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best_ns": min(timings) * 1e9,
+        "median_ns": statistics.median(timings) * 1e9,
+    }
+
+
+def run_benchmarks(names=None, repeat=5, number=None):
+    from django.utils import translation
+
+    from .suite import BENCHMARKS
+
+    results = {}
+    for name, (case, language) in sorted(BENCHMARKS.items()):
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+        with translation.override(language):
+            func = case()
+            if func is None:
+                continue
+            try:
+                func()  # warm up caches so every run measures the steady state
+                results[name] = time_callable(func, repeat=repeat, number=number)
+            finally:
+                teardown = getattr(func, "teardown", None)
+                if teardown is not None:
+                    teardown()
+    return {"environment": get_environment(), "results": results}
+
+
+def compare(results, baseline, threshold):
+    """Return names of benchmarks slower than baseline by over threshold."""
+    regressions = []
+    for name, result in sorted(results["results"].items()):
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        ratio = result["best_ns"] / previous["best_ns"]
+        print("%-50s %10.0f ns  x%.2f" % (name, result["best_ns"], ratio))
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="run benchmarks with these prefixes")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    results = run_benchmarks(args.names, repeat=args.repeat, number=args.number)
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    elif not args.compare:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Slower than baseline: %s" % ", ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
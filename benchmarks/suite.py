@@ -0,0 +1,376 @@
+"""Benchmark cases for django-prices hot paths.
+
+Every case is a function returning a zero-argument callable. Setup done in
+the case body is not timed, only the returned callable is. Cases are run
+with the given language activated. A case returns None when an optional
+dependency is missing. Resources created by a case are released by the
+`teardown` attribute of the returned callable, called after timing."""
+
+from decimal import Decimal
+
+from prices import Money, TaxedMoney, percentage_discount
+
+BENCHMARKS = {}
+
+LOCALES = ("en", "de", "pl", "ja")
+
+
+def benchmark(name, language="en"):
+    def decorator(func):
+        BENCHMARKS[name] = (func, language)
+        return func
+
+    return decorator
+
+
+def _format_price_case(html):
+    from django_prices.utils.formatting import format_price
+
+    value = Decimal("1234.56")
+    return lambda: format_price(value, "USD", html=html)
+
+
+for _language in LOCALES:
+    for _html in (False, True):
+        benchmark(
+            "format_price.%s.%s" % ("html" if _html else "text", _language),
+            language=_language,
+        )(lambda html=_html: _format_price_case(html))
+
+
+@benchmark("templatetags.amount.text")
+def amount_filter_text():
+    from django_prices.templatetags.prices import amount
+
+    value = Money("19.99", "USD")
+    return lambda: amount(value)
+
+
+@benchmark("templatetags.amount.html")
+def amount_filter_html():
+    from django_prices.templatetags.prices import amount
+
+    value = Money("19.99", "USD")
+    return lambda: amount(value, "html")
+
+
+@benchmark("templatetags.discount_amount_for")
+def discount_amount_for_filter():
+    from django_prices.templatetags.prices import discount_amount_for
+
+    price = TaxedMoney(Money(30, "USD"), Money(36, "USD"))
+
+    def discount(value):
+        return percentage_discount(value, percentage=10)
+
+    return lambda: discount_amount_for(discount, price)
+
+
+TEMPLATE_PRICES = [Money("%d.99" % i, "USD") for i in range(100)]
+
+
+@benchmark("templates.django.amount.100")
+def django_template_amount():
+    from django.template import Context, Template
+
+    template = Template(
+        "{% load prices %}{% for price in prices %}{{ price|amount:'html' }}"
+        "{% endfor %}"
+    )
+    context = Context({"prices": TEMPLATE_PRICES})
+    return lambda: template.render(context)
+
+
+@benchmark("templates.jinja2.amount.100")
+def jinja2_template_amount():
+    try:
+        import jinja2
+    except ImportError:
+        return None
+    from django_prices.jinja2 import PricesExtension
+
+    environment = jinja2.Environment(autoescape=True, extensions=[PricesExtension])
+    template = environment.from_string(
+        "{% for price in prices %}{{ price|amount('html') }}{% endfor %}"
+    )
+    return lambda: template.render(prices=TEMPLATE_PRICES)
+
+
+@benchmark("models.MoneyField.get")
+def money_field_get():
+    from tests.models import Model
+
+    instance = Model(price_net=Money("10", "USD"))
+    return lambda: instance.price_net
+
+
+@benchmark("models.MoneyField.set")
+def money_field_set():
+    from tests.models import Model
+
+    instance = Model()
+    value = Money("10", "USD")
+
+    def run():
+        instance.price_net = value
+
+    return run
+
+
+@benchmark("models.TaxedMoneyField.get")
+def taxed_money_field_get():
+    from tests.models import Model
+
+    instance = Model(price=TaxedMoney(Money("10", "USD"), Money("12", "USD")))
+    return lambda: instance.price
+
+
+@benchmark("models.TaxedMoneyField.set")
+def taxed_money_field_set():
+    from tests.models import Model
+
+    instance = Model()
+    value = TaxedMoney(Money("10", "USD"), Money("12", "USD"))
+
+    def run():
+        instance.price = value
+
+    return run
+
+
+@benchmark("forms.MoneyField.init")
+def form_field_init():
+    from django_prices.forms import MoneyField
+
+    return lambda: MoneyField(
+        available_currencies=["USD", "EUR", "GBP", "PLN", "BTC"],
+        max_digits=9,
+        decimal_places=2,
+    )
+
+
+@benchmark("forms.MoneyField.clean")
+def form_field_clean():
+    from django_prices.forms import MoneyField
+    from django_prices.validators import MaxMoneyValidator, MinMoneyValidator
+
+    field = MoneyField(
+        available_currencies=["USD", "EUR"],
+        max_digits=9,
+        decimal_places=2,
+        validators=[
+            MinMoneyValidator(Money(5, "USD")),
+            MaxMoneyValidator(Money(15, "USD")),
+        ],
+    )
+    return lambda: field.clean(["10.50", "USD"])
+
+
+@benchmark("forms.MoneyField.deepcopy")
+def form_field_deepcopy():
+    import copy
+
+    from babel.core import get_global
+
+    from django_prices.forms import MoneyField
+
+    currencies = sorted(get_global("all_currencies"))[:30]
+    field = MoneyField(available_currencies=currencies)
+    return lambda: copy.deepcopy(field)
+
+
+@benchmark("widgets.FixedCurrencyMoneyInput.render")
+def fixed_currency_widget_render():
+    from django_prices.widgets import FixedCurrencyMoneyInput
+
+    widget = FixedCurrencyMoneyInput(currency="USD")
+    value = Money("10", "USD")
+    return lambda: widget.render("price", value)
+
+
+@benchmark("widgets.FixedCurrencyMoneyInput.render.no_template")
+def fixed_currency_widget_render_without_template():
+    from django_prices.widgets import FixedCurrencyMoneyInput
+
+    widget = FixedCurrencyMoneyInput(currency="USD", use_template=False)
+    value = Money("10", "USD")
+    return lambda: widget.render("price", value)
+
+
+@benchmark("validators.MoneyPrecisionValidator")
+def precision_validator():
+    from django_prices.validators import MoneyPrecisionValidator
+
+    validator = MoneyPrecisionValidator(9, 2)
+    value = Money("10.50", "USD")
+    return lambda: validator(value)
+
+
+@benchmark("validators.MaxMoneyValidator")
+def max_money_validator():
+    from django_prices.validators import MaxMoneyValidator
+
+    validator = MaxMoneyValidator(Money(15, "USD"))
+    value = Money("10.50", "USD")
+    return lambda: validator(value)
+
+
+# Concurrency cases format the same prices in every worker, each worker in
+# its own locale. The time of a call divided by the number of workers shows
+# how formatting scales; shared caches are read without locks.
+CONCURRENCY_PRICES = [Decimal("%d.99" % i) for i in range(50)]
+CONCURRENCY_WORKERS = (1, 4, 16)
+
+
+def _concurrent_threads_case(workers):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from django_prices.utils.formatting import format_price
+    from django_prices.utils.locale import use_locale
+
+    def format_all(language):
+        with use_locale(language):
+            for value in CONCURRENCY_PRICES:
+                format_price(value, "USD")
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    languages = [LOCALES[i % len(LOCALES)] for i in range(workers)]
+
+    def run():
+        list(executor.map(format_all, languages))
+
+    run.teardown = executor.shutdown
+    return run
+
+
+def _concurrent_tasks_case(workers):
+    import asyncio
+
+    from django_prices.utils.formatting import format_price
+    from django_prices.utils.locale import use_locale
+
+    async def format_all(language):
+        with use_locale(language):
+            for value in CONCURRENCY_PRICES:
+                format_price(value, "USD")
+                # Let other tasks run in between, with their own locale
+                await asyncio.sleep(0)
+
+    async def run_all():
+        await asyncio.gather(*[format_all(language) for language in languages])
+
+    loop = asyncio.new_event_loop()
+    languages = [LOCALES[i % len(LOCALES)] for i in range(workers)]
+
+    def run():
+        loop.run_until_complete(run_all())
+
+    run.teardown = loop.close
+    return run
+
+
+for _workers in CONCURRENCY_WORKERS:
+    benchmark("concurrency.threads.%d" % _workers)(
+        lambda workers=_workers: _concurrent_threads_case(workers)
+    )
+    benchmark("concurrency.asyncio.%d" % _workers)(
+        lambda workers=_workers: _concurrent_tasks_case(workers)
+    )
+
+
+SERIALIZER_PRICES = [Money("%d.99" % i, ("USD", "EUR")[i % 2]) for i in range(100)]
+
+
+@benchmark("serializers.json.dumps.naive.100")
+def json_dumps_naive():
+    import json
+
+    def dumps():
+        return json.dumps(
+            [
+                {"amount": str(value.amount), "currency": value.currency}
+                for value in SERIALIZER_PRICES
+            ]
+        )
+
+    return dumps
+
+
+@benchmark("serializers.json.dumps.encoder.100")
+def json_dumps_encoder():
+    import json
+
+    from django_prices.serializers import MoneyJSONEncoder
+
+    return lambda: json.dumps(SERIALIZER_PRICES, cls=MoneyJSONEncoder)
+
+
+@benchmark("serializers.json.dumps.many.100")
+def json_dumps_many():
+    import json
+
+    from django_prices.serializers import encode_money_list
+
+    return lambda: json.dumps(encode_money_list(SERIALIZER_PRICES))
+
+
+@benchmark("serializers.json.loads.naive.100")
+def json_loads_naive():
+    import json
+
+    data = json.dumps(
+        [
+            {"amount": str(value.amount), "currency": value.currency}
+            for value in SERIALIZER_PRICES
+        ]
+    )
+
+    def loads():
+        return [
+            Money(Decimal(item["amount"]), item["currency"])
+            for item in json.loads(data)
+        ]
+
+    return loads
+
+
+@benchmark("serializers.json.loads.object_hook.100")
+def json_loads_object_hook():
+    import json
+
+    from django_prices.serializers import MoneyJSONEncoder, decode_money
+
+    data = json.dumps(SERIALIZER_PRICES, cls=MoneyJSONEncoder)
+    return lambda: json.loads(data, object_hook=decode_money)
+
+
+@benchmark("serializers.json.loads.many.100")
+def json_loads_many():
+    import json
+
+    from django_prices.serializers import decode_money_list, encode_money_list
+
+    data = json.dumps(encode_money_list(SERIALIZER_PRICES))
+    return lambda: decode_money_list(json.loads(data))
+
+
+@benchmark("serializers.orjson.dumps.100")
+def orjson_dumps_encoder():
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return None
+    from django_prices.serializers import orjson_dumps
+
+    return lambda: orjson_dumps(SERIALIZER_PRICES)
+
+
+@benchmark("serializers.msgpack.dumps.100")
+def msgpack_dumps_encoder():
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        return None
+    from django_prices.serializers import msgpack_dumps
+
+    return lambda: msgpack_dumps(SERIALIZER_PRICES)
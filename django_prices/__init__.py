@@ -0,0 +1,3 @@
+from .instrumentation import reset_stats, stats
+
+__all__ = ["reset_stats", "stats"]
@@ -0,0 +1,177 @@
+"""Currency conversion based on cached tables of exchange rates.
+
+Rates come from a rate provider, a class with a `get_rates()` method which
+returns a `(base_currency, rates)` pair, where `rates` maps currency codes to
+the amount of that currency worth one unit of the base currency. The provider
+is set with the `PRICES_RATE_PROVIDER` setting and defaults to
+`SettingsRateProvider`, which reads `PRICES_BASE_CURRENCY` and
+`PRICES_EXCHANGE_RATES`.
+
+Rates are fetched once and kept in memory as an immutable `RateTable` for
+`PRICES_RATE_TTL` seconds (an hour by default). Every fetched table gets a new
+version number, so results can be tied to the rates they were computed with.
+"""
+
+import threading
+import time
+from collections import namedtuple
+from decimal import Decimal
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from prices import Money, TaxedMoney
+
+__all__ = [
+    "RateTable",
+    "SettingsRateProvider",
+    "StaticRateProvider",
+    "clear_rate_table",
+    "convert",
+    "convert_many",
+    "get_base_currency",
+    "get_rate_table",
+    "refresh_rate_table",
+]
+
+DEFAULT_RATE_PROVIDER = "django_prices.conversion.SettingsRateProvider"
+DEFAULT_RATE_TTL = 3600
+
+_RateTableState = namedtuple("_RateTableState", ["table", "expires"])
+
+_state = None
+_version = 0
+_refresh_lock = threading.Lock()
+
+
+class StaticRateProvider:
+    """Provide a fixed set of rates, e.g. loaded from a fixture."""
+
+    def __init__(self, base_currency, rates):
+        self.base_currency = base_currency
+        self.rates = rates
+
+    def get_rates(self):
+        return self.base_currency, self.rates
+
+
+class SettingsRateProvider:
+    """Provide rates from the `PRICES_EXCHANGE_RATES` setting."""
+
+    def get_rates(self):
+        rates = getattr(settings, "PRICES_EXCHANGE_RATES", {})
+        return get_base_currency(), rates
+
+
+def get_base_currency():
+    base_currency = getattr(settings, "PRICES_BASE_CURRENCY", None)
+    if base_currency is None:
+        raise ImproperlyConfigured(
+            "Set PRICES_BASE_CURRENCY to convert between currencies."
+        )
+    return base_currency
+
+
+class RateTable:
+    """An immutable snapshot of exchange rates relative to one base currency."""
+
+    __slots__ = ("base_currency", "rates", "version", "_pair_rates")
+
+    def __init__(self, base_currency, rates, version=0):
+        rates = {code: Decimal(str(rate)) for code, rate in rates.items()}
+        rates[base_currency] = Decimal(1)
+        self.base_currency = base_currency
+        self.rates = MappingProxyType(rates)
+        self.version = version
+        self._pair_rates = {}
+
+    def __repr__(self):
+        return "RateTable(%r, version=%r)" % (self.base_currency, self.version)
+
+    def get_rate(self, from_currency, to_currency):
+        """Return the amount of `to_currency` worth one `from_currency`."""
+        key = (from_currency, to_currency)
+        rate = self._pair_rates.get(key)
+        if rate is None:
+            try:
+                rate = self.rates[to_currency] / self.rates[from_currency]
+            except KeyError as e:
+                raise ValueError("No exchange rate for %s." % (e.args[0],))
+            self._pair_rates[key] = rate
+        return rate
+
+    def convert(self, value, currency):
+        """Convert Money or TaxedMoney to `currency`.
+
+        Results are rounded to the precision of the target currency."""
+        if isinstance(value, TaxedMoney):
+            return TaxedMoney(
+                self.convert(value.net, currency), self.convert(value.gross, currency)
+            )
+        if value.currency == currency:
+            return value
+        rate = self.get_rate(value.currency, currency)
+        return Money(value.amount * rate, currency).quantize()
+
+
+def _get_rate_provider():
+    path = getattr(settings, "PRICES_RATE_PROVIDER", DEFAULT_RATE_PROVIDER)
+    return import_string(path)()
+
+
+def _refresh(provider):
+    global _state, _version
+    base_currency, rates = provider.get_rates()
+    _version += 1
+    table = RateTable(base_currency, rates, _version)
+    ttl = getattr(settings, "PRICES_RATE_TTL", DEFAULT_RATE_TTL)
+    _state = _RateTableState(table, time.monotonic() + ttl)
+    return table
+
+
+def get_rate_table():
+    """Return the current rate table, fetching rates if it has expired.
+
+    Reads don't take a lock; only one thread fetches new rates at a time."""
+    state = _state
+    if state is not None and state.expires > time.monotonic():
+        return state.table
+    with _refresh_lock:
+        state = _state
+        if state is not None and state.expires > time.monotonic():
+            return state.table
+        return _refresh(_get_rate_provider())
+
+
+def refresh_rate_table(provider=None):
+    """Fetch rates now, from `provider` or the configured rate provider."""
+    with _refresh_lock:
+        return _refresh(provider or _get_rate_provider())
+
+
+def clear_rate_table():
+    """Drop the cached rate table, so rates are fetched on next use."""
+    global _state
+    _state = None
+
+
+def convert(value, currency, table=None):
+    """Convert Money or TaxedMoney to `currency` using the current rates."""
+    if value is None:
+        return None
+    if table is None:
+        table = get_rate_table()
+    return table.convert(value, currency)
+
+
+def convert_many(values, currency, table=None):
+    """Convert an iterable of Money or TaxedMoney to `currency`.
+
+    All values are converted with one snapshot of rates. None values are
+    kept as they are. Returns a list."""
+    if table is None:
+        table = get_rate_table()
+    return [
+        None if value is None else table.convert(value, currency) for value in values
+    ]
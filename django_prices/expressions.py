@@ -0,0 +1,73 @@
+from django.core.exceptions import FieldError
+from django.db.models import DecimalField, Expression, F, FloatField, Func, Value
+from django.db.models.functions import Cast, NullIf
+
+from .models import TaxedMoneyField
+
+__all__ = ["TaxAmount", "TaxRate"]
+
+
+class TaxedMoneyExpression(Expression):
+    """Base for expressions computed from the columns of a TaxedMoneyField.
+
+    The field is looked up on the queried model when the expression is
+    resolved and replaced by an expression over its amount columns."""
+
+    def __init__(self, field_name):
+        super(TaxedMoneyExpression, self).__init__()
+        self.field_name = field_name
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.field_name)
+
+    def get_field(self, query):
+        field = query.model._meta.get_field(self.field_name)
+        if not isinstance(field, TaxedMoneyField):
+            raise FieldError("%s is not a TaxedMoneyField." % (self.field_name,))
+        return field
+
+    def build_expression(self, field):
+        raise NotImplementedError(
+            "Subclasses of TaxedMoneyExpression must provide build_expression()."
+        )
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        expression = self.build_expression(self.get_field(query))
+        return expression.resolve_expression(
+            query, allow_joins, reuse, summarize, for_save
+        )
+
+
+class TaxAmount(TaxedMoneyExpression):
+    """The tax of a TaxedMoneyField, i.e. its gross amount minus net amount."""
+
+    def build_expression(self, field):
+        return F(field.gross_amount_field) - F(field.net_amount_field)
+
+
+class _TaxRatio(Func):
+    arg_joiner = " / "
+    template = "(%(expressions)s)"
+    output_field = DecimalField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # SQLite stores integral decimals as integers and would divide them
+        # with integer division. The result is cast to NUMERIC, like Django
+        # does for decimal expressions, so it compares with decimal values.
+        numerator, denominator = self.get_source_expressions()
+        clone = self.copy()
+        clone.set_source_expressions([Cast(numerator, FloatField()), denominator])
+        sql, params = clone.as_sql(compiler, connection, **extra_context)
+        return "CAST(%s AS NUMERIC)" % sql, params
+
+
+class TaxRate(TaxedMoneyExpression):
+    """The tax rate of a TaxedMoneyField, e.g. 0.23 for 23% tax.
+
+    Rows with a zero net amount have no rate and are annotated with NULL."""
+
+    def build_expression(self, field):
+        net = F(field.net_amount_field)
+        return _TaxRatio(F(field.gross_amount_field) - net, NullIf(net, Value(0)))
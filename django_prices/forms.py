@@ -1,29 +1,50 @@
 import itertools
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
-from babel.numbers import get_currency_symbol
 from django import forms
 from django.core.validators import ValidationError
 from prices import Money
 
+from .utils.currencies import get_currency_symbol
 from .utils.locale import get_locale_data
 from .validators import MaxMoneyValidator, MinMoneyValidator, MoneyPrecisionValidator
 from .widgets import FixedCurrencyMoneyInput, MoneyInput
 
 __all__ = ("MoneyField", "MoneyInput")
 
+CHOICES_CACHE_SIZE = 128
 
-def _get_symbol(currency_code: str) -> str:
-    _, locale_code = get_locale_data()
-    return get_currency_symbol(currency_code, locale_code)
+
+@lru_cache(maxsize=CHOICES_CACHE_SIZE)
+def _build_currency_choices(
+    currencies: Tuple[str, ...], locale_code: str
+) -> Tuple[Tuple[str, str], ...]:
+    return tuple((code, get_currency_symbol(code, locale_code)) for code in currencies)
 
 
-def _get_currency_choices(currencies: List[str]) -> List[Tuple[str, str]]:
+def _get_currency_choices(currencies: List[str]) -> Tuple[Tuple[str, str], ...]:
     """Generate choices for SelectField.
-    As a label we are presenting currency symbol."""
-    currency_choices = [(code, _get_symbol(code)) for code in currencies]
-    return currency_choices
+    As a label we are presenting currency symbol.
+
+    Choices are cached per locale and list of currencies, the returned tuple
+    is shared between all callers."""
+    _, locale_code = get_locale_data()
+    return _build_currency_choices(tuple(currencies), locale_code)
+
+
+class CurrencyChoiceField(forms.ChoiceField):
+    """ChoiceField which shares its choices list between copies.
+
+    Django deep copies form fields for every form instance, including the
+    whole choices list. Currency choices are never modified in place, so
+    copies can safely reuse the same list."""
+
+    def __deepcopy__(self, memo):
+        result = forms.Field.__deepcopy__(self, memo)
+        result._choices = result.widget.choices = self._choices
+        return result
 
 
 class MoneyField(forms.MultiValueField):
@@ -52,7 +73,7 @@ class MoneyField(forms.MultiValueField):
         )
 
         choices = _get_currency_choices(available_currencies)
-        fields = (decimal_field, forms.ChoiceField(choices=choices))
+        fields = (decimal_field, CurrencyChoiceField(choices=choices))
 
         if widget is not None:
             raise NotImplementedError("Custom widgets are not supported by MoneyField.")
@@ -62,13 +83,14 @@ class MoneyField(forms.MultiValueField):
         elif len(available_currencies) == 1:
             widget_instance = FixedCurrencyMoneyInput(currency=available_currencies[0])
         else:
-            widget_instance = MoneyInput(
-                choices=_get_currency_choices(available_currencies)
-            )
+            widget_instance = MoneyInput(choices=choices)
 
         super(MoneyField, self).__init__(
             fields, widget=widget_instance, *args, **kwargs
         )
+        if isinstance(self.widget, MoneyInput):
+            # Django copies choices into a list, share one list for both
+            self.widget.widgets[1].choices = self.fields[1].choices
 
         self.validators = list(itertools.chain(self.default_validators, validators))
         self.validators.append(MoneyPrecisionValidator(max_digits, decimal_places))
@@ -0,0 +1,125 @@
+"""Optional call counting and timing for formatting and validation.
+
+Instrumentation is disabled by default and then costs a single flag check
+per call. Once enabled with `enable()`, every instrumented call updates its
+counters and sends the `operation_recorded` signal with `name` and
+`duration` (in seconds) arguments. Times are inclusive, so the time of the
+`amount` filter also contains the time of `format_price` it calls."""
+
+from functools import wraps
+from time import perf_counter
+
+from django.dispatch import Signal
+
+__all__ = [
+    "disable",
+    "enable",
+    "instrumented",
+    "is_enabled",
+    "operation_recorded",
+    "reset_stats",
+    "stats",
+]
+
+operation_recorded = Signal()
+
+_enabled = False
+# Maps operation names to [calls, cumulative time]
+_counters = {}
+# Cache counters at the time of the last reset, keyed by cache name
+_cache_offsets = {}
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def record(name, duration):
+    try:
+        counter = _counters[name]
+    except KeyError:
+        counter = _counters[name] = [0, 0.0]
+    counter[0] += 1
+    counter[1] += duration
+    operation_recorded.send(sender=None, name=name, duration=duration)
+
+
+def instrumented(name):
+    """Count calls and time spent in the decorated function."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def _get_cache_infos():
+    from .utils.formatting import (
+        get_formatter,
+        get_output_cache,
+        output_backend_cache_info,
+    )
+    from .utils.locale import locale_cache_info
+
+    return {
+        "formatter": get_formatter.cache_info(),
+        "locale": locale_cache_info(),
+        "output": get_output_cache().cache_info(),
+        "output_backend": output_backend_cache_info(),
+    }
+
+
+def stats():
+    """Return a snapshot of operation counters and cache hit rates."""
+    operations = {
+        name: {
+            "calls": calls,
+            "time": total,
+            "average": total / calls if calls else 0.0,
+        }
+        for name, (calls, total) in _counters.items()
+    }
+    caches = {}
+    for name, info in _get_cache_infos().items():
+        hits_offset, misses_offset = _cache_offsets.get(name, (0, 0))
+        hits = info.hits - hits_offset
+        misses = info.misses - misses_offset
+        if hits < 0 or misses < 0:
+            # The cache was cleared since the last reset
+            hits, misses = info.hits, info.misses
+        lookups = hits + misses
+        caches[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+    return {"enabled": _enabled, "operations": operations, "caches": caches}
+
+
+def reset_stats():
+    """Reset operation counters and start counting cache hits from zero."""
+    _counters.clear()
+    for name, info in _get_cache_infos().items():
+        _cache_offsets[name] = (info.hits, info.misses)
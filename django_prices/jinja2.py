@@ -0,0 +1,29 @@
+"""Jinja2 support for django-prices.
+
+Add the extension to the Jinja2 environment, for example in Django's
+`TEMPLATES` setting::
+
+    "OPTIONS": {"extensions": ["django_prices.jinja2.PricesExtension"]}
+
+It provides `amount`, `discount_amount_for` and `in_currency` as filters and
+globals, and the `amounts` global. They are the functions of the Django
+template library, so both engines share the cached formatters and give the
+same output."""
+
+from jinja2.ext import Extension
+
+from .templatetags.prices import amount, amounts, discount_amount_for, in_currency
+
+__all__ = ["PricesExtension"]
+
+
+class PricesExtension(Extension):
+    def __init__(self, environment):
+        super(PricesExtension, self).__init__(environment)
+        environment.filters["amount"] = amount
+        environment.filters["discount_amount_for"] = discount_amount_for
+        environment.filters["in_currency"] = in_currency
+        environment.globals["amount"] = amount
+        environment.globals["amounts"] = amounts
+        environment.globals["discount_amount_for"] = discount_amount_for
+        environment.globals["in_currency"] = in_currency
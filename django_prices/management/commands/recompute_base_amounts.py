@@ -0,0 +1,79 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...conversion import refresh_rate_table
+from ...models import MoneyField
+
+
+def get_base_amount_fields(labels):
+    if labels:
+        try:
+            models = [apps.get_model(label) for label in labels]
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+    else:
+        models = apps.get_models()
+    return [
+        (model, field)
+        for model in models
+        for field in model._meta.private_fields
+        if isinstance(field, MoneyField) and field.base_amount_field is not None
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute base currency amounts of money fields with a "
+        "base_amount_field, e.g. after exchange rates have changed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            metavar="app_label.ModelName",
+            help="Models to update, all models with base amounts by default.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows loaded and updated at once.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        # All rows are converted with the same, freshly fetched rates
+        table = refresh_rate_table()
+        for model, field in get_base_amount_fields(options["models"]):
+            updated = self.recompute(model, field, table, batch_size)
+            self.stdout.write(
+                "Updated %d %s rows of %s." % (updated, field.name, model._meta.label)
+            )
+
+    def recompute(self, model, field, table, batch_size):
+        queryset = (
+            model._default_manager.only(
+                "pk", field.amount_field, field.currency_field, field.base_amount_field
+            )
+            .order_by("pk")
+            .iterator(chunk_size=batch_size)
+        )
+        updated = 0
+        batch = []
+        for instance in queryset:
+            base_amount = field.get_base_amount(
+                getattr(instance, field.amount_field),
+                getattr(instance, field.currency_field),
+                table,
+            )
+            setattr(instance, field.base_amount_field, base_amount)
+            batch.append(instance)
+            if len(batch) >= batch_size:
+                model._default_manager.bulk_update(batch, [field.base_amount_field])
+                updated += len(batch)
+                batch = []
+        if batch:
+            model._default_manager.bulk_update(batch, [field.base_amount_field])
+            updated += len(batch)
+        return updated
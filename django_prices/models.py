@@ -1,12 +1,48 @@
 from decimal import Decimal
 
 from django.core import validators
-from django.db.models import Field
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Field, Index
+from django.db.models.signals import class_prepared, post_save, pre_save
 from prices import Money, TaxedMoney
 
-from . import forms
+from .utils.currencies import (
+    from_minor_units,
+    get_currency_code,
+    get_currency_number,
+    scale_to_minor_units,
+    to_minor_units,
+)
+
 from functools import total_ordering
 
+NOT_RESOLVED = object()
+
+
+class ImmutableMoney(Money):
+    """Money that can't be modified, so it's safe to share between instances."""
+
+    __slots__ = ()
+
+    def __init__(self, amount, currency):
+        object.__setattr__(self, "amount", Decimal(amount))
+        object.__setattr__(self, "currency", currency)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("%s is immutable" % type(self).__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError("%s is immutable" % type(self).__name__)
+
+    def __reduce__(self):
+        return type(self), (self.amount, self.currency)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
 
 @total_ordering
 class NonDatabaseFieldBase:
@@ -29,6 +65,11 @@ class NonDatabaseFieldBase:
     one_to_many = None
     one_to_one = None
 
+    cache_name = None
+    db_index = False
+    # Store currencies as ISO 4217 numeric codes, e.g. 840 for USD
+    numeric_currency = False
+
     def __init__(self):
         self.column = None
         self.primary_key = False
@@ -51,9 +92,44 @@ class NonDatabaseFieldBase:
 
     def contribute_to_class(self, cls, name, **kwargs):
         self.attname = self.name = name
+        self.cache_name = "_%s_cache" % name
         self.model = cls
         cls._meta.add_field(self, private=True)
         setattr(cls, name, self)
+        if self.db_index and not cls._meta.abstract:
+            self.add_indexes(cls)
+
+    def get_index_fields(self):
+        """Return lists of column fields to index together."""
+        return []
+
+    def get_db_currency(self, currency):
+        """Convert a currency code to the value stored in the currency field."""
+        if self.numeric_currency:
+            return get_currency_number(currency)
+        return currency
+
+    def get_currency(self, value):
+        """Convert a value stored in the currency field to a currency code."""
+        if self.numeric_currency and value is not None:
+            return get_currency_code(value)
+        return value
+
+    def add_indexes(self, cls):
+        indexed = [list(index.fields) for index in cls._meta.indexes]
+        new_indexes = [
+            Index(fields=fields)
+            for fields in self.get_index_fields()
+            if fields not in indexed
+        ]
+        if not new_indexes:
+            return
+        # Options.indexes may be the list defined in Meta, which can be shared
+        # with other models, so it's replaced instead of extended in place.
+        # Index names are set by Django once all fields are added. Migrations
+        # only read indexes listed in original_attrs.
+        cls._meta.indexes = list(cls._meta.indexes) + new_indexes
+        cls._meta.original_attrs["indexes"] = cls._meta.indexes
 
     def clean(self, value, model_instance):
         # Shortcircut clean() because Django calls it on all fields with
@@ -73,12 +149,27 @@ class MoneyField(NonDatabaseFieldBase):
         amount_field="price_amount",
         currency_field="price_currency",
         verbose_name=None,
+        cached=False,
+        db_index=False,
+        minor_units=False,
+        numeric_currency=False,
+        base_amount_field=None,
         **kwargs
     ):
         super(MoneyField, self).__init__()
         self.amount_field = amount_field
         self.currency_field = currency_field
         self.verbose_name = verbose_name
+        self.cached = cached
+        self.db_index = db_index
+        # Store amounts as integer number of minor units, e.g. cents
+        self.minor_units = minor_units
+        self.numeric_currency = numeric_currency
+        # Keep a copy of the amount converted to PRICES_BASE_CURRENCY, so
+        # rows in different currencies can be compared in SQL
+        self.base_amount_field = base_amount_field
+        self._default = NOT_RESOLVED
+        self._available_currencies = NOT_RESOLVED
 
     def __str__(self):
         return "MoneyField(amount_field=%s, currency_field=%s)" % (
@@ -93,27 +184,161 @@ class MoneyField(NonDatabaseFieldBase):
         amount = getattr(instance, self.amount_field)
         currency = getattr(instance, self.currency_field)
         if amount is not None and currency is not None:
-            return Money(amount, currency)
+            if not self.cached:
+                return self.build_money(amount, currency)
+            # The cache is only valid for the exact objects it was built from,
+            # so assigning the underlying attributes invalidates it
+            cached = instance.__dict__.get(self.cache_name)
+            if cached is not None and cached[0] is amount and cached[1] is currency:
+                return cached[2]
+            value = self.build_money(amount, currency)
+            instance.__dict__[self.cache_name] = (amount, currency, value)
+            return value
         return self.get_default()
 
     def __set__(self, instance, value):
+        instance.__dict__.pop(self.cache_name, None)
         amount = None
         currency = None
         if value is not None:
-            amount = value.amount
-            currency = value.currency
+            amount = self.get_db_amount(value.amount, value.currency)
+            currency = self.get_db_currency(value.currency)
         setattr(instance, self.amount_field, amount)
         setattr(instance, self.currency_field, currency)
+        if self.base_amount_field is not None:
+            setattr(
+                instance, self.base_amount_field, self.get_base_amount(amount, currency)
+            )
+
+    def build_money(self, amount, currency):
+        """Build Money from values stored in the amount and currency fields."""
+        currency = self.get_currency(currency)
+        if self.minor_units:
+            amount = from_minor_units(amount, currency)
+        return Money(amount, currency)
+
+    def get_db_amount(self, amount, currency):
+        """Convert an amount to the value stored in the amount field."""
+        if self.minor_units:
+            return to_minor_units(amount, currency)
+        return amount
+
+    def get_lookup_amount(self, amount, currency):
+        """Convert an amount to a value to compare the amount field with."""
+        if self.minor_units:
+            return scale_to_minor_units(amount, currency)
+        return amount
+
+    def get_base_amount(self, amount, currency, table=None):
+        """Convert values of the amount and currency fields to an amount in
+        the base currency, using `table` or the current exchange rates.
+
+        Returns None when there is no rate for the currency, so a missing rate
+        doesn't prevent saving; such rows can be recomputed later."""
+        if amount is None or currency is None:
+            return None
+        # Conversion is only needed by models with a base amount field
+        from . import conversion
+
+        value = self.build_money(amount, currency)
+        try:
+            return conversion.convert(
+                value, conversion.get_base_currency(), table
+            ).amount
+        except (ImproperlyConfigured, ValueError):
+            return None
+
+    def _saves_money_columns(self, update_fields):
+        """Whether a save of `update_fields` writes the amount or currency."""
+        return update_fields is None or not update_fields.isdisjoint(
+            (self.amount_field, self.currency_field)
+        )
+
+    def update_base_amount(
+        self, sender, instance, raw=False, update_fields=None, **kwargs
+    ):
+        """Recompute the base amount before saving, as the amount and currency
+        fields may have been changed directly. Fixtures are saved as they are."""
+        if raw or not self._saves_money_columns(update_fields):
+            return
+        amount = getattr(instance, self.amount_field)
+        currency = getattr(instance, self.currency_field)
+        setattr(
+            instance, self.base_amount_field, self.get_base_amount(amount, currency)
+        )
+
+    def save_base_amount(
+        self, sender, instance, raw=False, update_fields=None, using=None, **kwargs
+    ):
+        """Write the base amount after a save of the amount or currency with
+        `update_fields` which doesn't include it, as signals can't extend it."""
+        if raw or update_fields is None or self.base_amount_field in update_fields:
+            return
+        if not self._saves_money_columns(update_fields):
+            return
+        sender._base_manager.using(using).filter(pk=instance.pk).update(
+            **{self.base_amount_field: getattr(instance, self.base_amount_field)}
+        )
+
+    def get_index_fields(self):
+        index_fields = [[self.currency_field, self.amount_field]]
+        if self.base_amount_field is not None:
+            index_fields.append([self.base_amount_field])
+        return index_fields
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super(MoneyField, self).contribute_to_class(cls, name, **kwargs)
+        # Fields inherited from abstract models are deep copies, which don't
+        # keep the identity of the sentinel
+        self._default = NOT_RESOLVED
+        self._available_currencies = NOT_RESOLVED
+        if not cls._meta.abstract:
+            class_prepared.connect(self.resolve_model_fields, sender=cls, weak=False)
+            if self.base_amount_field is not None:
+                pre_save.connect(self.update_base_amount, sender=cls, weak=False)
+                post_save.connect(self.save_base_amount, sender=cls, weak=False)
+
+    def resolve_model_fields(self, sender, **kwargs):
+        """Look up the amount and currency fields once the model is ready.
+
+        Defaults and currency choices are computed here, so they don't need
+        `_meta` lookups on every access. Callable defaults are still evaluated
+        on each call to `get_default()`."""
+        try:
+            amount_field = sender._meta.get_field(self.amount_field)
+            currency_field = sender._meta.get_field(self.currency_field)
+        except FieldDoesNotExist:
+            return
+        self._available_currencies = tuple(
+            self.get_currency(code) for code, _ in currency_field.flatchoices
+        )
+        if callable(amount_field.default) or callable(currency_field.default):
+            return
+        default_amount = amount_field.get_default()
+        if default_amount is None:
+            self._default = None
+        else:
+            default = self.build_money(default_amount, currency_field.get_default())
+            self._default = ImmutableMoney(default.amount, default.currency)
+
+    def get_available_currencies(self):
+        if self._available_currencies is not NOT_RESOLVED:
+            return list(self._available_currencies)
+        if not hasattr(self, "model"):
+            return []
+        currency_field = self.model._meta.get_field(self.currency_field)
+        return [self.get_currency(code) for code, _ in currency_field.flatchoices]
 
     def formfield(self, **kwargs):
-        available_currencies = []
-        if hasattr(self, "model"):
-            available_currencies = self.model._meta.get_field(
-                self.currency_field
-            ).choices
-        return forms.MoneyField(available_currencies=available_currencies)
+        # Form support pulls in widgets, validators and babel based formatting,
+        # so it's only imported when a form is actually built
+        from . import forms
+
+        return forms.MoneyField(available_currencies=self.get_available_currencies())
 
     def get_default(self):
+        if self._default is not NOT_RESOLVED:
+            return self._default
         default_currency = None
         default_amount = Decimal(0)
         if hasattr(self, "model"):
@@ -124,7 +349,7 @@ class MoneyField(NonDatabaseFieldBase):
 
         if default_amount is None:
             return None
-        return Money(default_amount, default_currency)
+        return self.build_money(default_amount, default_currency)
 
 
 class TaxedMoneyField(NonDatabaseFieldBase):
@@ -137,6 +362,9 @@ class TaxedMoneyField(NonDatabaseFieldBase):
         gross_amount_field="price_amount_gross",
         currency="currency",
         verbose_name=None,
+        cached=False,
+        db_index=False,
+        numeric_currency=False,
         **kwargs
     ):
         super(TaxedMoneyField, self).__init__()
@@ -144,6 +372,9 @@ class TaxedMoneyField(NonDatabaseFieldBase):
         self.gross_amount_field = gross_amount_field
         self.currency = currency
         self.verbose_name = verbose_name
+        self.cached = cached
+        self.db_index = db_index
+        self.numeric_currency = numeric_currency
 
     def __str__(self):
         return (
@@ -151,6 +382,19 @@ class TaxedMoneyField(NonDatabaseFieldBase):
             % (self.net_amount_field, self.gross_amount_field, self.currency)
         )
 
+    def get_index_fields(self):
+        return [
+            [self.currency, self.net_amount_field],
+            [self.currency, self.gross_amount_field],
+        ]
+
+    def get_lookup_amount(self, amount, currency):
+        return amount
+
+    def build_taxed_money(self, net_amount, gross_amount, currency):
+        currency = self.get_currency(currency)
+        return TaxedMoney(Money(net_amount, currency), Money(gross_amount, currency))
+
     def __get__(self, instance, cls=None):
         if instance is None:
             return self
@@ -159,16 +403,29 @@ class TaxedMoneyField(NonDatabaseFieldBase):
         currency = getattr(instance, self.currency)
         if net_amount is None or gross_amount is None:
             return None
-        return TaxedMoney(Money(net_amount, currency), Money(gross_amount, currency))
+        if not self.cached:
+            return self.build_taxed_money(net_amount, gross_amount, currency)
+        cached = instance.__dict__.get(self.cache_name)
+        if (
+            cached is not None
+            and cached[0] is net_amount
+            and cached[1] is gross_amount
+            and cached[2] is currency
+        ):
+            return cached[3]
+        value = self.build_taxed_money(net_amount, gross_amount, currency)
+        instance.__dict__[self.cache_name] = (net_amount, gross_amount, currency, value)
+        return value
 
     def __set__(self, instance, value):
+        instance.__dict__.pop(self.cache_name, None)
         net_amount = None
         gross_amount = None
         currency = None
         if value is not None:
             net_amount = value.net.amount
             gross_amount = value.gross.amount
-            currency = value.currency
+            currency = self.get_db_currency(value.currency)
         setattr(instance, self.net_amount_field, net_amount)
         setattr(instance, self.gross_amount_field, gross_amount)
         setattr(instance, self.currency, currency)
@@ -0,0 +1,180 @@
+"""Migration operations for changing how money fields are stored.
+
+To move a MoneyField from a DecimalField amount to integer minor units:
+
+1. Add a nullable `BigIntegerField` for the minor units next to the existing
+   amount field and run `makemigrations`.
+2. Add `ConvertToMinorUnits` to the generated migration's operations.
+3. Remove the old amount field, make the new one non-nullable if needed, set
+   `minor_units=True` on the MoneyField and point its `amount_field` to the
+   new column.
+"""
+
+from django.db import router
+from django.db.migrations.operations.base import Operation
+
+from .utils.currencies import from_minor_units, get_currency_code, to_minor_units
+
+__all__ = ["ConvertFromMinorUnits", "ConvertToMinorUnits"]
+
+
+def _convert_rows(
+    apps,
+    using,
+    model,
+    source_field,
+    target_field,
+    currency_field,
+    convert,
+    batch_size,
+    numeric_currency=False,
+):
+    app_label, model_name = model.split(".")
+    model_class = apps.get_model(app_label, model_name)
+    manager = model_class._default_manager.db_manager(using)
+    queryset = (
+        manager.filter(**{"%s__isnull" % source_field: False})
+        .exclude(**{"%s__isnull" % currency_field: True})
+        .only("pk", source_field, currency_field)
+        .order_by("pk")
+    )
+    batch = []
+    for instance in queryset.iterator(chunk_size=batch_size):
+        currency = getattr(instance, currency_field)
+        if numeric_currency:
+            currency = get_currency_code(currency)
+        value = convert(getattr(instance, source_field), currency)
+        setattr(instance, target_field, value)
+        batch.append(instance)
+        if len(batch) >= batch_size:
+            manager.bulk_update(batch, [target_field])
+            batch = []
+    if batch:
+        manager.bulk_update(batch, [target_field])
+
+
+class ConvertToMinorUnits(Operation):
+    """Copy decimal amounts into an integer column of minor units.
+
+    `model` is given as "app_label.ModelName". Rows are processed in batches
+    of `batch_size`. Amounts with more decimal places than their currency
+    allows raise ValueError. Reversing the migration copies the minor units
+    back into the decimal column. Pass `numeric_currency=True` when currencies
+    are stored as ISO 4217 numeric codes."""
+
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(
+        self,
+        model,
+        amount_field,
+        minor_units_field,
+        currency_field,
+        batch_size=1000,
+        numeric_currency=False,
+    ):
+        self.model = model
+        self.amount_field = amount_field
+        self.minor_units_field = minor_units_field
+        self.currency_field = currency_field
+        self.batch_size = batch_size
+        self.numeric_currency = numeric_currency
+
+    def deconstruct(self):
+        kwargs = {
+            "model": self.model,
+            "amount_field": self.amount_field,
+            "minor_units_field": self.minor_units_field,
+            "currency_field": self.currency_field,
+        }
+        if self.batch_size != 1000:
+            kwargs["batch_size"] = self.batch_size
+        if self.numeric_currency:
+            kwargs["numeric_currency"] = self.numeric_currency
+        return (self.__class__.__qualname__, [], kwargs)
+
+    def describe(self):
+        return "Convert %s.%s to minor units in %s" % (
+            self.model,
+            self.amount_field,
+            self.minor_units_field,
+        )
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def to_minor_units(self, apps, using):
+        _convert_rows(
+            apps,
+            using,
+            self.model,
+            self.amount_field,
+            self.minor_units_field,
+            self.currency_field,
+            to_minor_units,
+            self.batch_size,
+            self.numeric_currency,
+        )
+
+    def from_minor_units(self, apps, using):
+        _convert_rows(
+            apps,
+            using,
+            self.model,
+            self.minor_units_field,
+            self.amount_field,
+            self.currency_field,
+            from_minor_units,
+            self.batch_size,
+            self.numeric_currency,
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        using = schema_editor.connection.alias
+        if router.allow_migrate(using, app_label):
+            self.to_minor_units(from_state.apps, using)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        using = schema_editor.connection.alias
+        if router.allow_migrate(using, app_label):
+            self.from_minor_units(from_state.apps, using)
+
+
+class ConvertFromMinorUnits(ConvertToMinorUnits):
+    """Copy integer minor units into a decimal amount column."""
+
+    def __init__(
+        self,
+        model,
+        minor_units_field,
+        amount_field,
+        currency_field,
+        batch_size=1000,
+        numeric_currency=False,
+    ):
+        super(ConvertFromMinorUnits, self).__init__(
+            model,
+            amount_field,
+            minor_units_field,
+            currency_field,
+            batch_size=batch_size,
+            numeric_currency=numeric_currency,
+        )
+
+    def describe(self):
+        return "Convert %s.%s from minor units in %s" % (
+            self.model,
+            self.minor_units_field,
+            self.amount_field,
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        super(ConvertFromMinorUnits, self).database_backwards(
+            app_label, schema_editor, from_state, to_state
+        )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        super(ConvertFromMinorUnits, self).database_forwards(
+            app_label, schema_editor, from_state, to_state
+        )
@@ -0,0 +1,207 @@
+from decimal import Decimal
+
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db import models
+from django.db.models import Avg, Q, Sum
+from django.db.models.constants import LOOKUP_SEP
+from prices import Money, TaxedMoney
+
+from .models import MoneyField, TaxedMoneyField
+
+__all__ = ["MoneyManager", "MoneyQuerySet", "aggregate_money", "expand_money_lookups"]
+
+MONEY_LOOKUPS = ("exact", "gt", "gte", "lt", "lte")
+# Aggregates of net and gross amounts which also hold for the pair of them
+TAXED_MONEY_AGGREGATES = (Sum, Avg)
+
+
+def _amount_lookup(field, currency_field, amount_field, lookup, value):
+    if value is None:
+        if lookup != "exact":
+            raise ValueError("None is only allowed for exact money lookups.")
+        return Q(**{"%s__isnull" % amount_field: True})
+    if not isinstance(value, Money):
+        raise TypeError("Money lookups require a Money value, got %r." % (value,))
+    amount = field.get_lookup_amount(value.amount, value.currency)
+    currency = field.get_db_currency(value.currency)
+    # Currency equality goes first so the (currency, amount) index is usable
+    return Q(**{currency_field: currency}) & Q(
+        **{"%s__%s" % (amount_field, lookup): amount}
+    )
+
+
+def _get_lookup(key, rest):
+    lookup = rest[0] if rest else "exact"
+    if len(rest) > 1 or lookup not in MONEY_LOOKUPS:
+        raise FieldError(
+            "Unsupported lookup %r, money fields support: %s."
+            % (key, ", ".join(MONEY_LOOKUPS))
+        )
+    return lookup
+
+
+def _base_amount_lookup(field, lookup, value):
+    if value is None:
+        if lookup != "exact":
+            raise ValueError("None is only allowed for exact money lookups.")
+        return Q(**{"%s__isnull" % field.base_amount_field: True})
+    if not isinstance(value, Money):
+        raise TypeError("Money lookups require a Money value, got %r." % (value,))
+    # Imported here, like in MoneyField, to keep it optional
+    from .conversion import convert, get_base_currency
+
+    amount = convert(value, get_base_currency()).amount
+    return Q(**{"%s__%s" % (field.base_amount_field, lookup): amount})
+
+
+def _expand_lookup(model, key, value):
+    parts = key.split(LOOKUP_SEP)
+    try:
+        field = model._meta.get_field(parts[0])
+    except FieldDoesNotExist:
+        return None
+    if isinstance(field, MoneyField):
+        if len(parts) > 1 and parts[1] == "base":
+            if field.base_amount_field is None:
+                raise FieldError("%s has no base_amount_field." % (parts[0],))
+            return _base_amount_lookup(field, _get_lookup(key, parts[2:]), value)
+        rest = parts[1:]
+        amount_field = field.amount_field
+        currency_field = field.currency_field
+    elif isinstance(field, TaxedMoneyField):
+        if len(parts) == 1 or parts[1] == "exact":
+            if len(parts) > 2:
+                raise FieldError("Unsupported lookup %r." % key)
+            if value is None:
+                return Q(**{"%s__isnull" % field.net_amount_field: True})
+            if not isinstance(value, TaxedMoney):
+                raise TypeError(
+                    "TaxedMoney lookups require a TaxedMoney value, got %r." % (value,)
+                )
+            return (
+                Q(**{field.currency: field.get_db_currency(value.currency)})
+                & Q(**{field.net_amount_field: value.net.amount})
+                & Q(**{field.gross_amount_field: value.gross.amount})
+            )
+        if parts[1] == "net":
+            amount_field = field.net_amount_field
+        elif parts[1] == "gross":
+            amount_field = field.gross_amount_field
+        else:
+            raise FieldError(
+                "Use %s__net or %s__gross to filter by TaxedMoneyField."
+                % (parts[0], parts[0])
+            )
+        rest = parts[2:]
+        currency_field = field.currency
+    else:
+        return None
+    lookup = _get_lookup(key, rest)
+    return _amount_lookup(field, currency_field, amount_field, lookup, value)
+
+
+def _expand_q(model, q):
+    expanded = Q()
+    expanded.connector = q.connector
+    expanded.negated = q.negated
+    for child in q.children:
+        if isinstance(child, Q):
+            expanded.children.append(_expand_q(model, child))
+            continue
+        # Children may also be conditional expressions, e.g. Exists()
+        if not (
+            isinstance(child, tuple) and len(child) == 2 and isinstance(child[0], str)
+        ):
+            expanded.children.append(child)
+            continue
+        money_q = _expand_lookup(model, *child)
+        expanded.children.append(child if money_q is None else money_q)
+    return expanded
+
+
+def expand_money_lookups(model, *args, **kwargs):
+    """Rewrite lookups on money fields into lookups on their columns.
+
+    `price_net__gte=Money(10, "USD")` becomes `currency="USD"` and
+    `price_net_amount__gte=10`. TaxedMoneyField is filtered through its
+    `net` and `gross` parts, e.g. `price__gross__lt=Money(10, "USD")`.
+    MoneyField with a `base_amount_field` can be compared across currencies
+    through its `base` part, e.g. `price__base__gte=Money(10, "EUR")`.
+    Returns a tuple of Q objects to pass to `filter()` or `exclude()`."""
+    result = [_expand_q(model, arg) if isinstance(arg, Q) else arg for arg in args]
+    if kwargs:
+        result.append(_expand_q(model, Q(**kwargs)))
+    return tuple(result)
+
+
+def aggregate_money(queryset, field_name, function=Sum):
+    """Aggregate a MoneyField or TaxedMoneyField in the database.
+
+    Rows are grouped by currency and `function` (e.g. Sum, Avg, Min, Max) is
+    applied to the amount columns. Returns a dict mapping currency codes to
+    Money for MoneyField and to TaxedMoney for TaxedMoneyField. Rows without
+    a currency are skipped.
+
+    TaxedMoneyField only supports Sum and Avg, as e.g. the highest net and
+    gross amounts may come from different rows."""
+    field = queryset.model._meta.get_field(field_name)
+    queryset = queryset.order_by()
+    if isinstance(field, TaxedMoneyField):
+        if function not in TAXED_MONEY_AGGREGATES:
+            raise TypeError("TaxedMoneyField can only be aggregated with Sum or Avg.")
+        currency_field = field.currency
+        rows = (
+            queryset.filter(**{"%s__isnull" % currency_field: False})
+            .values(currency_field)
+            .annotate(
+                django_prices_net=function(field.net_amount_field),
+                django_prices_gross=function(field.gross_amount_field),
+            )
+        )
+        totals = {}
+        for row in rows:
+            net = row["django_prices_net"]
+            gross = row["django_prices_gross"]
+            if net is None or gross is None:
+                continue
+            if isinstance(net, float):
+                net = Decimal(str(net))
+                gross = Decimal(str(gross))
+            value = field.build_taxed_money(net, gross, row[currency_field])
+            totals[value.currency] = value
+        return totals
+    if isinstance(field, MoneyField):
+        currency_field = field.currency_field
+        rows = (
+            queryset.filter(**{"%s__isnull" % currency_field: False})
+            .values(currency_field)
+            .annotate(django_prices_total=function(field.amount_field))
+        )
+        totals = {}
+        for row in rows:
+            total = row["django_prices_total"]
+            if total is None:
+                continue
+            if isinstance(total, float):
+                # Avg of an integer column, e.g. amounts in minor units
+                total = Decimal(str(total))
+            value = field.build_money(total, row[currency_field])
+            totals[value.currency] = value
+        return totals
+    raise TypeError("%s is not a MoneyField or TaxedMoneyField." % (field_name,))
+
+
+class MoneyQuerySet(models.QuerySet):
+    """QuerySet which understands lookups and aggregates on money fields."""
+
+    def filter(self, *args, **kwargs):
+        return super().filter(*expand_money_lookups(self.model, *args, **kwargs))
+
+    def exclude(self, *args, **kwargs):
+        return super().exclude(*expand_money_lookups(self.model, *args, **kwargs))
+
+    def aggregate_money(self, field_name, function=Sum):
+        return aggregate_money(self, field_name, function)
+
+
+MoneyManager = models.Manager.from_queryset(MoneyQuerySet)
@@ -0,0 +1,204 @@
+"""Serialization of Money and TaxedMoney values.
+
+Money is encoded as `{"amount": "9.99", "currency": "USD"}` and TaxedMoney as
+`{"net": {...}, "gross": {...}}`, with amounts as strings so no precision is
+lost. Use `encode_money` as the `default` of orjson or msgpack, or
+`MoneyJSONEncoder` with the `json` module. `decode_money` is the matching
+`object_hook`.
+
+Lists of Money can be encoded in a columnar format with `encode_money_list`,
+which stores every currency once.
+
+The module is also a Django serialization format. Register it with
+`SERIALIZATION_MODULES = {"prices_json": "django_prices.serializers"}` to
+include money fields in `serializers.serialize("prices_json", queryset)`."""
+
+import json
+
+from django.apps import apps
+from django.core.serializers import json as json_serializer
+from django.core.serializers import python as python_serializer
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.json import DjangoJSONEncoder
+from prices import Money, TaxedMoney
+
+from .models import MoneyField, TaxedMoneyField
+
+__all__ = [
+    "Deserializer",
+    "MoneyJSONEncoder",
+    "Serializer",
+    "decode_money",
+    "decode_money_list",
+    "encode_money",
+    "encode_money_list",
+    "msgpack_dumps",
+    "msgpack_loads",
+    "orjson_dumps",
+    "orjson_loads",
+]
+
+
+def encode_money(value):
+    """Encode Money or TaxedMoney as a dict of JSON compatible values."""
+    if isinstance(value, Money):
+        return {"amount": str(value.amount), "currency": value.currency}
+    if isinstance(value, TaxedMoney):
+        return {"net": encode_money(value.net), "gross": encode_money(value.gross)}
+    raise TypeError("Object of type %s is not serializable." % type(value).__name__)
+
+
+def decode_money(obj):
+    """Decode a dict created by `encode_money`, return other dicts unchanged."""
+    if len(obj) == 2:
+        if "amount" in obj and "currency" in obj:
+            return Money(obj["amount"], obj["currency"])
+        if "net" in obj and "gross" in obj:
+            net = _decode_value(obj["net"])
+            gross = _decode_value(obj["gross"])
+            if isinstance(net, Money) and isinstance(gross, Money):
+                return TaxedMoney(net, gross)
+    return obj
+
+
+def _decode_value(value):
+    # Nested values are already decoded when used as an object hook
+    return decode_money(value) if isinstance(value, dict) else value
+
+
+def _decode_tree(value):
+    if isinstance(value, dict):
+        return decode_money({key: _decode_tree(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_decode_tree(item) for item in value]
+    return value
+
+
+class MoneyJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder for Money and TaxedMoney, along with Django's types."""
+
+    def default(self, o):
+        if isinstance(o, (Money, TaxedMoney)):
+            return encode_money(o)
+        return super(MoneyJSONEncoder, self).default(o)
+
+
+def encode_money_list(values):
+    """Encode a list of Money in a columnar format.
+
+    Returns `{"currencies": [...], "amounts": [...]}` with every currency
+    listed once. When values have more than one currency, `"index"` lists
+    the position of every value's currency in `"currencies"`. None values
+    are encoded as null amounts."""
+    currencies = []
+    positions = {}
+    amounts = []
+    index = []
+    for value in values:
+        if value is None:
+            amounts.append(None)
+            index.append(0)
+            continue
+        currency = value.currency
+        position = positions.get(currency)
+        if position is None:
+            position = positions[currency] = len(currencies)
+            currencies.append(currency)
+        amounts.append(str(value.amount))
+        index.append(position)
+    data = {"currencies": currencies, "amounts": amounts}
+    if len(currencies) > 1:
+        data["index"] = index
+    return data
+
+
+def decode_money_list(data):
+    """Decode a list of Money encoded with `encode_money_list`."""
+    currencies = data["currencies"]
+    amounts = data["amounts"]
+    if "index" not in data:
+        if not currencies:
+            return [None] * len(amounts)
+        currency = currencies[0]
+        return [
+            None if amount is None else Money(amount, currency) for amount in amounts
+        ]
+    return [
+        None if amount is None else Money(amount, currencies[position])
+        for amount, position in zip(amounts, data["index"])
+    ]
+
+
+def orjson_dumps(obj, **kwargs):
+    """Serialize to JSON bytes with orjson, which needs to be installed."""
+    import orjson
+
+    return orjson.dumps(obj, default=encode_money, **kwargs)
+
+
+def orjson_loads(data):
+    """Deserialize JSON with orjson, decoding Money and TaxedMoney."""
+    import orjson
+
+    # orjson has no object hook, so the result is walked once
+    return _decode_tree(orjson.loads(data))
+
+
+def msgpack_dumps(obj, **kwargs):
+    """Serialize to MessagePack, which needs to be installed."""
+    import msgpack
+
+    return msgpack.packb(obj, default=encode_money, **kwargs)
+
+
+def msgpack_loads(data, **kwargs):
+    """Deserialize MessagePack, decoding Money and TaxedMoney."""
+    import msgpack
+
+    return msgpack.unpackb(data, object_hook=decode_money, **kwargs)
+
+
+def _get_money_fields(model):
+    return [
+        field
+        for field in model._meta.private_fields
+        if isinstance(field, (MoneyField, TaxedMoneyField))
+    ]
+
+
+class Serializer(json_serializer.Serializer):
+    """Django's JSON serializer which also outputs money fields."""
+
+    def get_dump_object(self, obj):
+        data = super(Serializer, self).get_dump_object(obj)
+        for field in _get_money_fields(obj._meta.model):
+            if self.selected_fields is not None:
+                if field.name not in self.selected_fields:
+                    continue
+            value = getattr(obj, field.name)
+            data["fields"][field.name] = None if value is None else encode_money(value)
+        return data
+
+
+def Deserializer(stream_or_string, **options):
+    """Deserialize JSON written by `Serializer`.
+
+    Money fields are skipped, as their amount and currency columns are
+    serialized too. When serializing selected fields, include the columns."""
+    if not isinstance(stream_or_string, (bytes, str)):
+        stream_or_string = stream_or_string.read()
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    try:
+        objects = json.loads(stream_or_string)
+    except Exception as exc:
+        raise DeserializationError() from exc
+    for obj in objects:
+        try:
+            model = apps.get_model(obj["model"])
+        except (KeyError, LookupError, ValueError):
+            # Let Django's deserializer report the error
+            continue
+        for field in _get_money_fields(model):
+            obj.get("fields", {}).pop(field.name, None)
+    yield from python_serializer.Deserializer(objects, **options)
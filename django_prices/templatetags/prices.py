@@ -1,14 +1,15 @@
 from django import template
 
-from enmerkar.templatetags.babel import currencyfmt
-
-from ..utils.formatting import format_price
+from .. import conversion
+from ..instrumentation import instrumented
+from ..utils.formatting import format_price, format_prices
 
 
 register = template.Library()
 
 
 @register.filter
+@instrumented("amount")
 def amount(obj, format="text"):
     if format == "text":
         return format_price(obj.amount, obj.currency, html=False)
@@ -17,6 +18,58 @@ def amount(obj, format="text"):
     return currencyfmt(obj.amount, obj.currency)
 
 
+def currencyfmt(number, currency):
+    # enmerkar is only needed for formats other than "text" and "html", so
+    # it's imported on first use. This also keeps it out of the Jinja2 setup.
+    from enmerkar.templatetags.babel import currencyfmt
+
+    return currencyfmt(number, currency)
+
+
+@register.simple_tag
+@instrumented("amounts")
+def amounts(items, format="text", attr=None, currency=None):
+    """Format prices of all items at once, for use in a loop.
+
+    Returns a list of `(item, formatted_price)` pairs. When `attr` is given
+    (e.g. "price.gross") the Money is looked up on every item using that
+    dotted path, otherwise items are expected to be Money objects. When
+    `currency` is given, all prices are converted to it first using one
+    snapshot of exchange rates.
+
+        {% amounts products "html" attr="price.gross" as rows %}
+        {% for product, price in rows %}...{% endfor %}
+    """
+    items = list(items)
+    values = items
+    if attr is not None:
+        path = attr.split(".")
+        values = []
+        for item in items:
+            value = item
+            for name in path:
+                value = getattr(value, name)
+            values.append(value)
+    if currency is not None:
+        values = conversion.convert_many(values, currency)
+    if format in ("text", "html"):
+        formatted = format_prices(values, html=format == "html")
+    else:
+        formatted = [currencyfmt(value.amount, value.currency) for value in values]
+    return list(zip(items, formatted))
+
+
+@register.filter
+@instrumented("in_currency")
+def in_currency(obj, currency):
+    """Convert Money or TaxedMoney to another currency, e.g.
+
+    {{ product.price|in_currency:"EUR"|amount }}
+    """
+    return conversion.convert(obj, currency)
+
+
 @register.filter
+@instrumented("discount_amount_for")
 def discount_amount_for(discount, price):
     return discount(price) - price
@@ -1,36 +1,147 @@
 import re
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
-from babel.core import get_global
-from babel.numbers import format_currency
+from babel.core import Locale
+from babel.numbers import format_currency, parse_pattern
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
 from django.utils.safestring import mark_safe
 
-from .locale import get_locale_data
+from ..instrumentation import instrumented
+from .currencies import get_currency_info
+from .locale import CacheInfo, get_locale_data
+
+FORMATTER_CACHE_SIZE = 256
+OUTPUT_CACHE_SIZE = 4096
+
+# Formatted prices keyed by amount, currency, locale and output type. It's
+# created on first use, so its size can come from settings.
+_output_cache = None
+_backend_hits = 0
+_backend_misses = 0
 
 
 def get_currency_fraction(currency):
-    fractions = get_global("currency_fractions")
-    try:
-        fraction = fractions[currency]
-    except KeyError:
-        fraction = fractions["DEFAULT"]
-    return fraction[0]
+    return get_currency_info(currency).precision
+
+
+class PriceFormatter:
+    """Render amounts of one currency with a precompiled locale pattern."""
+
+    __slots__ = ("locale", "currency", "html", "pattern")
+
+    def __init__(self, locale, currency, html=False):
+        pattern = locale.currency_formats.get("standard").pattern
+        if html:
+            pattern = re.sub("(\xa4+)", '<span class="currency">\\1</span>', pattern)
+        self.locale = locale
+        self.currency = currency
+        self.html = html
+        self.pattern = parse_pattern(pattern)
+
+    def __call__(self, value):
+        # Babel skips parsing when given a Locale and a NumberPattern
+        return format_currency(
+            value, self.currency, format=self.pattern, locale=self.locale
+        )
+
+
+@lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def get_formatter(locale_code, currency, html=False):
+    """
+    Return a cached formatter for given locale, currency and output type
+    """
+    return PriceFormatter(Locale.parse(locale_code), currency, html=html)
+
+
+def _render_price(value, currency, locale_code, html):
+    global _backend_hits, _backend_misses
+    alias = getattr(settings, "PRICES_FORMAT_CACHE_BACKEND", None)
+    if alias is None:
+        return mark_safe(get_formatter(locale_code, currency, html)(value))
+    # Second level shared between processes, stores plain strings
+    cache = caches[alias]
+    key = "django_prices:%s:%s:%s:%d" % (locale_code, currency, value, html)
+    result = cache.get(key)
+    if result is None:
+        _backend_misses += 1
+        result = get_formatter(locale_code, currency, html)(value)
+        cache.set(key, result)
+    else:
+        _backend_hits += 1
+    return mark_safe(result)
+
 
+def get_output_cache():
+    """
+    Return the memoized price rendering function
+    """
+    global _output_cache
+    output_cache = _output_cache
+    if output_cache is None:
+        size = getattr(settings, "PRICES_FORMAT_CACHE_SIZE", OUTPUT_CACHE_SIZE)
+        output_cache = _output_cache = lru_cache(maxsize=size)(_render_price)
+    return output_cache
+
+
+def _is_cacheable(value):
+    # Negative zero equals zero but is rendered with a minus sign. NaN never
+    # equals itself, so it would add a new entry on every call.
+    return not value.is_nan() and not (value.is_zero() and value.is_signed())
+
+
+def output_backend_cache_info():
+    return CacheInfo(_backend_hits, _backend_misses, None, None)
+
+
+def clear_output_cache():
+    global _output_cache, _backend_hits, _backend_misses
+    _output_cache = None
+    _backend_hits = _backend_misses = 0
 
-def format_price(value, currency, html=False):
+
+def _output_cache_setting_changed(setting, **kwargs):
+    if setting in ("PRICES_FORMAT_CACHE_SIZE", "PRICES_FORMAT_CACHE_BACKEND"):
+        clear_output_cache()
+
+
+setting_changed.connect(_output_cache_setting_changed)
+
+
+@instrumented("format_price")
+def format_price(value, currency, html=False, locale=None):
     """
-    Format decimal value as currency
+    Format decimal value as currency, in given or current locale
     """
     try:
         value = Decimal(value)
     except (TypeError, InvalidOperation):
         return ""
 
-    locale, locale_code = get_locale_data()
-    pattern = locale.currency_formats.get("standard").pattern
+    _, locale_code = get_locale_data(locale)
+    if not _is_cacheable(value):
+        return _render_price(value, currency, locale_code, html)
+    return get_output_cache()(value, currency, locale_code, html)
 
-    if html:
-        pattern = re.sub("(\xa4+)", '<span class="currency">\\1</span>', pattern)
 
-    result = format_currency(value, currency, format=pattern, locale=locale_code)
-    return mark_safe(result)
+@instrumented("format_prices")
+def format_prices(values, html=False, locale=None):
+    """
+    Format an iterable of Money objects, resolving locale only once
+    """
+    _, locale_code = get_locale_data(locale)
+    render = get_output_cache()
+    results = []
+    for value in values:
+        try:
+            amount = Decimal(value.amount)
+        except (TypeError, InvalidOperation):
+            results.append("")
+            continue
+        if not _is_cacheable(amount):
+            results.append(_render_price(amount, value.currency, locale_code, html))
+            continue
+        results.append(render(amount, value.currency, locale_code, html))
+    return results
@@ -1,12 +1,45 @@
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from babel.core import Locale, UnknownLocaleError
 from django.conf import settings
 from django.utils.translation import get_language, to_locale
 
+from ..instrumentation import instrumented
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Languages can come from `use_locale()` or the `locale` argument of
+# formatting functions, e.g. taken from a request, so the cache is capped.
+# Once it's full, other languages are parsed on every call.
+LOCALE_CACHE_SIZE = 256
+
+# Maps (active language, default language) to parsed locale data. Languages
+# which fail to parse are stored with the fallback data, so the exception
+# path is only taken once per language. Reads don't lock: entries are never
+# changed once stored, and two threads parsing the same language store equal
+# data. Hit and miss counters may be slightly off under concurrency.
+_locale_cache = {}
+_cache_hits = 0
+_cache_misses = 0
+
+# Language to format prices in instead of Django's active language. Context
+# variables are separate for every thread and asyncio task.
+_language_override = ContextVar("django_prices_language", default=None)
+
+
+@contextmanager
+def use_locale(language):
+    """Format prices in given language within the block, e.g. "de" or "pt-br"."""
+    token = _language_override.set(language)
+    try:
+        yield
+    finally:
+        _language_override.reset(token)
+
 
-def get_locale_data():
-    language = get_language()
-    if not language:
-        language = settings.LANGUAGE_CODE
+def _parse_locale_data(language, default_language):
     locale_code = to_locale(language)
     locale = None
     try:
@@ -14,7 +47,40 @@ def get_locale_data():
     except (ValueError, UnknownLocaleError):
         # Invalid format or unknown locale
         # Fallback to the default language
-        language = settings.LANGUAGE_CODE
-        locale_code = to_locale(language)
+        locale_code = to_locale(default_language)
         locale = Locale.parse(locale_code)
     return locale, locale_code
+
+
+@instrumented("get_locale_data")
+def get_locale_data(language=None):
+    """Return the Locale and locale code to format prices with.
+
+    The language is, in order: the `language` argument, the one set with
+    `use_locale()`, Django's active language and `settings.LANGUAGE_CODE`."""
+    global _cache_hits, _cache_misses
+    default_language = settings.LANGUAGE_CODE
+    language = (
+        language or _language_override.get() or get_language() or default_language
+    )
+    key = (language, default_language)
+    try:
+        data = _locale_cache[key]
+    except KeyError:
+        pass
+    else:
+        _cache_hits += 1
+        return data
+    _cache_misses += 1
+    data = _parse_locale_data(language, default_language)
+    if len(_locale_cache) < LOCALE_CACHE_SIZE:
+        _locale_cache[key] = data
+    return data
+
+
+def locale_cache_info():
+    return CacheInfo(_cache_hits, _cache_misses, LOCALE_CACHE_SIZE, len(_locale_cache))
+
+
+def clear_locale_cache():
+    _locale_cache.clear()
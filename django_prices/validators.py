@@ -1,4 +1,5 @@
-from babel.numbers import get_currency_precision, is_currency
+from collections import namedtuple
+
 from django.core.validators import (
     DecimalValidator,
     MaxValueValidator,
@@ -6,6 +7,8 @@ from django.core.validators import (
     ValidationError,
 )
 
+from .instrumentation import instrumented
+from .utils.currencies import exceeds_precision, get_currency_info
 from .utils.formatting import format_price
 
 
@@ -13,27 +16,23 @@ class MoneyPrecisionValidator(DecimalValidator):
     def __init__(self, *args):
         super(MoneyPrecisionValidator, self).__init__(*args)
 
+    @instrumented("MoneyPrecisionValidator")
     def __call__(self, other):
         value = other.amount
         currency = other.currency
         super(MoneyPrecisionValidator, self).__call__(value)
 
-        if is_currency(currency):
-            currency_precision = get_currency_precision(currency)
-            exponent = value.as_tuple()[-1]
-            if exponent >= 0:
-                decimals = 0
-            else:
-                decimals = abs(exponent)
-            if decimals > currency_precision:
-                raise ValidationError(
-                    self.messages["max_decimal_places"],
-                    code="max_decimal_places",
-                    params={"max": currency_precision},
-                )
+        currency_info = get_currency_info(currency)
+        if currency_info.known and exceeds_precision(value, currency_info.precision):
+            raise ValidationError(
+                self.messages["max_decimal_places"],
+                code="max_decimal_places",
+                params={"max": currency_info.precision},
+            )
 
 
 class MoneyValueValidator:
+    @instrumented("MoneyValueValidator")
     def __call__(self, value):
         cleaned = self.clean(value)
         if cleaned.currency != self.limit_value.currency:
@@ -54,3 +53,119 @@ class MaxMoneyValidator(MoneyValueValidator, MaxValueValidator):
 
 class MinMoneyValidator(MoneyValueValidator, MinValueValidator):
     pass
+
+
+LIMIT_MESSAGES = {
+    "max_value": MaxValueValidator.message,
+    "min_value": MinValueValidator.message,
+}
+
+
+MoneyValidationError = namedtuple("MoneyValidationError", ["index", "code", "params"])
+
+
+class MoneyValidationReport:
+    """Errors found by `validate_money_batch`.
+
+    Errors are kept as `(index, code, params)` tuples with raw values, so
+    nothing is formatted until `messages()` is called."""
+
+    def __init__(self, errors):
+        self.errors = errors
+
+    def __len__(self):
+        return len(self.errors)
+
+    def __iter__(self):
+        return iter(self.errors)
+
+    @property
+    def is_valid(self):
+        return not self.errors
+
+    @property
+    def invalid_indexes(self):
+        return sorted({error.index for error in self.errors})
+
+    def get_message(self, error):
+        params = error.params
+        if error.code in LIMIT_MESSAGES:
+            limit_value = params["limit_value"]
+            currency = limit_value.currency
+            params = {
+                "limit_value": format_price(limit_value.amount, currency),
+                "show_value": format_price(params["value"].amount, currency),
+                "value": format_price(params["value"].amount, currency),
+            }
+            message = LIMIT_MESSAGES[error.code]
+        else:
+            message = DecimalValidator.messages[error.code]
+        return ValidationError(message, code=error.code, params=params).messages[0]
+
+    def messages(self):
+        """Return a list of `(index, message)` pairs."""
+        return [(error.index, self.get_message(error)) for error in self.errors]
+
+
+def _get_limits(limits, pick):
+    by_currency = {}
+    for limit in limits or ():
+        current = by_currency.get(limit.currency)
+        by_currency[limit.currency] = limit if current is None else pick(current, limit)
+    return by_currency
+
+
+def validate_money_batch(
+    values, max_digits=None, decimal_places=None, min_values=None, max_values=None
+):
+    """Validate a sequence of Money objects in a single pass.
+
+    Runs the same checks as `MoneyPrecisionValidator`, `MinMoneyValidator` and
+    `MaxMoneyValidator`. Limits are grouped by currency and, when several
+    are given for one currency, the strictest one is used. `None` values are
+    skipped. Returns a `MoneyValidationReport`."""
+    decimal_validator = DecimalValidator(max_digits, decimal_places)
+    min_limits = _get_limits(min_values, max)
+    max_limits = _get_limits(max_values, min)
+    precisions = {}
+    errors = []
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+        amount = value.amount
+        currency = value.currency
+        try:
+            decimal_validator(amount)
+        except ValidationError as error:
+            errors.append(MoneyValidationError(index, error.code, error.params))
+            if error.code == "invalid":
+                continue
+        else:
+            try:
+                precision = precisions[currency]
+            except KeyError:
+                info = get_currency_info(currency)
+                precision = precisions[currency] = (
+                    info.precision if info.known else None
+                )
+            if precision is not None and exceeds_precision(amount, precision):
+                errors.append(
+                    MoneyValidationError(
+                        index, "max_decimal_places", {"max": precision, "value": amount}
+                    )
+                )
+        limit = min_limits.get(currency)
+        if limit is not None and amount < limit.amount:
+            errors.append(
+                MoneyValidationError(
+                    index, "min_value", {"limit_value": limit, "value": value}
+                )
+            )
+        limit = max_limits.get(currency)
+        if limit is not None and amount > limit.amount:
+            errors.append(
+                MoneyValidationError(
+                    index, "max_value", {"limit_value": limit, "value": value}
+                )
+            )
+    return MoneyValidationReport(errors)
@@ -1,5 +1,6 @@
 from django import forms
 from django.template.loader import render_to_string
+from django.utils.html import format_html
 from prices import Money
 
 __all__ = ["MoneyInput", "FixedCurrencyMoneyInput"]
@@ -13,6 +14,12 @@ class MoneyInput(forms.MultiWidget):
         ]
         super(MoneyInput, self).__init__(widgets, attrs)
 
+    def __deepcopy__(self, memo):
+        obj = super(MoneyInput, self).__deepcopy__(memo)
+        # Choices are not modified in place, so copies share the list
+        obj.widgets[1].choices = self.widgets[1].choices
+        return obj
+
     def decompress(self, value):
         if value and isinstance(value, Money):
             return [value.amount, value.currency]
@@ -20,10 +27,19 @@ class MoneyInput(forms.MultiWidget):
 
 
 class FixedCurrencyMoneyInput(forms.MultiWidget):
+    """Amount input followed by a fixed currency code.
+
+    With `use_template=False` the output is assembled directly instead of
+    rendering `prices/widget.html`. The HTML is the same as the default
+    template's, but overrides of that template are ignored."""
+
     template = "prices/widget.html"
+    use_template = True
 
-    def __init__(self, currency, attrs=None):
+    def __init__(self, currency, attrs=None, use_template=None):
         self.currency = currency
+        if use_template is not None:
+            self.use_template = use_template
         widgets = [
             forms.TextInput(attrs={"type": "number", "step": "any"}),
             forms.HiddenInput(),
@@ -39,6 +55,8 @@ class FixedCurrencyMoneyInput(forms.MultiWidget):
         widget = super(FixedCurrencyMoneyInput, self).render(
             name, value, attrs=attrs, renderer=renderer
         )
+        if not self.use_template:
+            return format_html("{} {}", widget, self.currency)
         return render_to_string(
             self.template, {"widget": widget, "value": value, "currency": self.currency}
         )
@@ -30,7 +30,13 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/mirumee/django-prices",
-    packages=["django_prices", "django_prices.templatetags", "django_prices.utils"],
+    packages=[
+        "django_prices",
+        "django_prices.management",
+        "django_prices.management.commands",
+        "django_prices.templatetags",
+        "django_prices.utils",
+    ],
     include_package_data=True,
     classifiers=CLASSIFIERS,
     install_requires=[
@@ -39,6 +45,11 @@ setup(
         "enmerkar>=0.7.1",
         "prices>=1.0.0",
     ],
+    extras_require={
+        "jinja2": ["Jinja2>=2.10"],
+        "msgpack": ["msgpack>=1.0"],
+        "orjson": ["orjson>=3.0"],
+    },
     platforms=["any"],
     zip_safe=False,
 )
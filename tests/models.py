@@ -1,5 +1,8 @@
+from decimal import Decimal
+
 from django.db import models
 from django_prices.models import MoneyField, TaxedMoneyField
+from django_prices.query import MoneyManager
 
 AVAILABLE_CURRENCIES = [("BTC", "bitcoins"), ("USD", "US dollar")]
 
@@ -28,6 +31,8 @@ class Model(models.Model):
         currency="currency",
     )
 
+    objects = MoneyManager()
+
 
 class NullModel(models.Model):
     DEFAULT_CURRENCY = "BTC"
@@ -50,3 +55,113 @@ class NullModel(models.Model):
         gross_amount_field="price_gross_amount",
         currency="currency",
     )
+
+    objects = MoneyManager()
+
+
+class CachedModel(models.Model):
+    currency = models.CharField(
+        max_length=3, default="BTC", choices=AVAILABLE_CURRENCIES
+    )
+    price_net_amount = models.DecimalField(max_digits=9, decimal_places=2, default="5")
+    price_net = MoneyField(
+        amount_field="price_net_amount", currency_field="currency", cached=True
+    )
+    price_gross_amount = models.DecimalField(
+        max_digits=9, decimal_places=2, default="5"
+    )
+    price = TaxedMoneyField(
+        net_amount_field="price_net_amount",
+        gross_amount_field="price_gross_amount",
+        currency="currency",
+        cached=True,
+    )
+
+
+class IndexedModel(models.Model):
+    currency = models.CharField(max_length=3, default="BTC")
+    price_net_amount = models.DecimalField(max_digits=9, decimal_places=2, default="5")
+    price_net = MoneyField(
+        amount_field="price_net_amount", currency_field="currency", db_index=True
+    )
+    price_gross_amount = models.DecimalField(
+        max_digits=9, decimal_places=2, default="5"
+    )
+    price = TaxedMoneyField(
+        net_amount_field="price_net_amount",
+        gross_amount_field="price_gross_amount",
+        currency="currency",
+        db_index=True,
+    )
+
+
+class MinorUnitsModel(models.Model):
+    currency = models.CharField(max_length=3, default="USD")
+    price_amount = models.DecimalField(
+        max_digits=9, decimal_places=2, null=True, default=None
+    )
+    price_minor_units = models.BigIntegerField(default=500)
+    price = MoneyField(
+        amount_field="price_minor_units", currency_field="currency", minor_units=True
+    )
+
+    objects = MoneyManager()
+
+
+class NumericCurrencyModel(models.Model):
+    currency = models.SmallIntegerField(
+        default=840, choices=[(840, "US dollar"), (978, "Euro")]
+    )
+    price_net_amount = models.DecimalField(max_digits=9, decimal_places=2, default="5")
+    price_net = MoneyField(
+        amount_field="price_net_amount",
+        currency_field="currency",
+        numeric_currency=True,
+        db_index=True,
+    )
+    price_gross_amount = models.DecimalField(
+        max_digits=9, decimal_places=2, default="5"
+    )
+    price = TaxedMoneyField(
+        net_amount_field="price_net_amount",
+        gross_amount_field="price_gross_amount",
+        currency="currency",
+        numeric_currency=True,
+    )
+
+    objects = MoneyManager()
+
+
+class BaseCurrencyModel(models.Model):
+    currency = models.CharField(max_length=3, default="USD")
+    price_amount = models.DecimalField(max_digits=9, decimal_places=2, default="5")
+    price_base_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, null=True, blank=True
+    )
+    price = MoneyField(
+        amount_field="price_amount",
+        currency_field="currency",
+        base_amount_field="price_base_amount",
+        db_index=True,
+    )
+
+    objects = MoneyManager()
+
+
+def get_default_amount():
+    return Decimal("7")
+
+
+class AbstractCallableDefaultModel(models.Model):
+    currency = models.CharField(max_length=3, default="USD")
+    price_amount = models.DecimalField(
+        max_digits=9, decimal_places=2, null=True, default=get_default_amount
+    )
+    price = MoneyField(amount_field="price_amount", currency_field="currency")
+
+    class Meta:
+        abstract = True
+
+
+class InheritedCallableDefaultModel(AbstractCallableDefaultModel):
+    pass
@@ -0,0 +1,104 @@
+# coding: utf-8
+from decimal import Decimal
+
+import pytest
+from django.core import serializers
+from django.core.exceptions import FieldError
+from django.core.management import call_command
+from prices import Money
+
+from django_prices import conversion
+
+from .models import BaseCurrencyModel, Model
+
+
+@pytest.fixture(autouse=True)
+def rates(settings):
+    settings.PRICES_BASE_CURRENCY = "USD"
+    settings.PRICES_EXCHANGE_RATES = {"EUR": "0.5", "PLN": "4"}
+    conversion.clear_rate_table()
+    yield
+    conversion.clear_rate_table()
+
+
+def test_base_amount_is_set_with_money():
+    instance = BaseCurrencyModel()
+    instance.price = Money("10", "EUR")
+    assert instance.price_base_amount == Decimal("20")
+    instance.price = None
+    assert instance.price_base_amount is None
+
+
+def test_base_amount_is_updated_on_save(db):
+    instance = BaseCurrencyModel.objects.create()
+    assert instance.price_base_amount == Decimal("5")
+    instance.currency = "PLN"
+    instance.save()
+    instance.refresh_from_db()
+    assert instance.price_base_amount == Decimal("1.25")
+
+
+def test_base_amount_is_null_without_exchange_rate(db, settings):
+    instance = BaseCurrencyModel.objects.create(price=Money("10", "GBP"))
+    instance.refresh_from_db()
+    assert instance.price == Money("10", "GBP")
+    assert instance.price_base_amount is None
+    del settings.PRICES_BASE_CURRENCY
+    conversion.clear_rate_table()
+    instance = BaseCurrencyModel(price=Money("10", "EUR"))
+    assert instance.price_base_amount is None
+
+
+def test_base_amount_is_saved_with_update_fields(db):
+    instance = BaseCurrencyModel.objects.create(price=Money("10", "EUR"))
+    instance.price_amount = Decimal("30")
+    instance.save(update_fields=["price_amount"])
+    instance.refresh_from_db()
+    assert instance.price_base_amount == Decimal("60")
+    instance.price_base_amount = Decimal("1")
+    instance.save(update_fields=["price_base_amount"])
+    instance.refresh_from_db()
+    assert instance.price_base_amount == Decimal("1")
+
+
+def test_base_amount_is_not_recomputed_for_fixtures(db, settings):
+    data = (
+        '[{"model": "tests.basecurrencymodel", "pk": 1, "fields": {"currency": '
+        '"EUR", "price_amount": "10", "price_base_amount": "99"}}]'
+    )
+    del settings.PRICES_BASE_CURRENCY
+    conversion.clear_rate_table()
+    for obj in serializers.deserialize("json", data):
+        obj.save()
+    assert BaseCurrencyModel.objects.get().price_base_amount == Decimal("99")
+
+
+def test_base_amount_is_indexed():
+    indexes = [index.fields for index in BaseCurrencyModel._meta.indexes]
+    assert ["price_base_amount"] in indexes
+
+
+def test_order_and_filter_across_currencies(db):
+    BaseCurrencyModel.objects.create(price=Money("10", "EUR"))
+    BaseCurrencyModel.objects.create(price=Money("10", "PLN"))
+    BaseCurrencyModel.objects.create(price=Money("10", "USD"))
+    ordered = BaseCurrencyModel.objects.order_by("price_base_amount")
+    assert [row.currency for row in ordered] == ["PLN", "USD", "EUR"]
+    queryset = BaseCurrencyModel.objects.filter(price__base__gte=Money("20", "PLN"))
+    assert sorted(row.currency for row in queryset) == ["EUR", "USD"]
+
+
+def test_base_lookup_requires_base_amount_field(db):
+    with pytest.raises(FieldError):
+        Model.objects.filter(price_net__base__gt=Money("1", "USD"))
+
+
+def test_recompute_base_amounts_command(db, settings):
+    BaseCurrencyModel.objects.create(price=Money("10", "EUR"))
+    BaseCurrencyModel.objects.create(price=Money("8", "PLN"))
+    settings.PRICES_EXCHANGE_RATES = {"EUR": "0.8", "PLN": "2"}
+    call_command("recompute_base_amounts", "tests.BaseCurrencyModel", batch_size=1)
+    amounts = BaseCurrencyModel.objects.order_by("pk").values_list(
+        "price_base_amount", flat=True
+    )
+    assert list(amounts) == [Decimal("12.50"), Decimal("4")]
@@ -0,0 +1,40 @@
+# coding: utf-8
+import threading
+
+from benchmarks.run import compare, run_benchmarks
+from benchmarks.suite import BENCHMARKS
+
+
+def test_all_benchmarks_run():
+    results = run_benchmarks(repeat=1, number=1)
+    assert set(results["results"]) <= set(BENCHMARKS)
+    assert "format_price.text.en" in results["results"]
+    assert "django" in results["environment"]
+
+
+def test_compare_reports_regressions():
+    baseline = {"results": {"a": {"best_ns": 100.0}, "b": {"best_ns": 100.0}}}
+    results = {"results": {"a": {"best_ns": 150.0}, "b": {"best_ns": 110.0}}}
+    assert compare(results, baseline, threshold=0.2) == ["a"]
+
+
+def test_concurrency_benchmarks_release_threads():
+    threads = threading.active_count()
+    results = run_benchmarks(["concurrency."], repeat=1, number=1)
+    assert "concurrency.threads.16" in results["results"]
+    assert threading.active_count() == threads
+
+
+def test_teardown_runs_after_timing(monkeypatch):
+    calls = []
+
+    def case():
+        def run():
+            calls.append("run")
+
+        run.teardown = lambda: calls.append("teardown")
+        return run
+
+    monkeypatch.setitem(BENCHMARKS, "test.teardown", (case, "en"))
+    run_benchmarks(["test.teardown"], repeat=1, number=1)
+    assert calls == ["run", "run", "teardown"]
@@ -0,0 +1,114 @@
+# coding: utf-8
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
+from prices import Money, TaxedMoney
+
+from django_prices import conversion
+from django_prices.conversion import (
+    RateTable,
+    StaticRateProvider,
+    convert,
+    convert_many,
+    get_rate_table,
+    refresh_rate_table,
+)
+
+
+class CountingProvider(StaticRateProvider):
+    calls = 0
+
+    def get_rates(self):
+        CountingProvider.calls += 1
+        return super(CountingProvider, self).get_rates()
+
+
+def make_provider():
+    return CountingProvider("USD", {"EUR": "0.5", "PLN": 4, "JPY": 100})
+
+
+@pytest.fixture(autouse=True)
+def rates(settings):
+    settings.PRICES_RATE_PROVIDER = "tests.test_conversion.make_provider"
+    CountingProvider.calls = 0
+    conversion.clear_rate_table()
+    yield
+    conversion.clear_rate_table()
+
+
+def test_rate_table_converts_between_any_currencies():
+    table = RateTable("USD", {"EUR": "0.5", "PLN": 4})
+    assert table.get_rate("EUR", "PLN") == Decimal(8)
+    assert table.convert(Money("10", "USD"), "EUR") == Money("5", "EUR")
+    assert table.convert(Money("10", "PLN"), "EUR") == Money("1.25", "EUR")
+    assert table.convert(Money("1", "PLN"), "EUR") == Money("0.13", "EUR")
+    price = TaxedMoney(Money("10", "USD"), Money("12", "USD"))
+    assert table.convert(price, "PLN") == TaxedMoney(
+        Money("40", "PLN"), Money("48", "PLN")
+    )
+
+
+def test_rate_table_rejects_unknown_currency():
+    table = RateTable("USD", {"EUR": "0.5"})
+    with pytest.raises(ValueError):
+        table.convert(Money("10", "GBP"), "EUR")
+
+
+def test_rate_table_is_fetched_once_per_ttl(settings):
+    table = get_rate_table()
+    assert get_rate_table() is table
+    assert CountingProvider.calls == 1
+    settings.PRICES_RATE_TTL = 0
+    conversion.clear_rate_table()
+    first = get_rate_table()
+    second = get_rate_table()
+    assert second.version > first.version
+    assert CountingProvider.calls == 3
+
+
+def test_refresh_rate_table_with_provider():
+    old = get_rate_table()
+    table = refresh_rate_table(StaticRateProvider("EUR", {"USD": 2}))
+    assert table.version > old.version
+    assert get_rate_table() is table
+    assert convert(Money("1", "EUR"), "USD") == Money("2", "USD")
+
+
+def test_settings_rate_provider(settings):
+    settings.PRICES_RATE_PROVIDER = "django_prices.conversion.SettingsRateProvider"
+    settings.PRICES_BASE_CURRENCY = "EUR"
+    settings.PRICES_EXCHANGE_RATES = {"USD": "1.10"}
+    assert convert(Money("10", "EUR"), "USD") == Money("11", "USD")
+
+
+def test_settings_rate_provider_requires_base_currency(settings):
+    settings.PRICES_RATE_PROVIDER = "django_prices.conversion.SettingsRateProvider"
+    with pytest.raises(ImproperlyConfigured):
+        get_rate_table()
+
+
+def test_convert_many_uses_one_snapshot():
+    values = [Money("1", "USD"), None, Money("100", "JPY"), Money("2", "PLN")]
+    assert convert_many(values, "EUR") == [
+        Money("0.5", "EUR"),
+        None,
+        Money("0.5", "EUR"),
+        Money("0.25", "EUR"),
+    ]
+    assert CountingProvider.calls == 1
+
+
+def test_in_currency_filter():
+    template = Template('{% load prices %}{{ price|in_currency:"PLN"|amount }}')
+    assert template.render(Context({"price": Money("10", "USD")})) == "PLN40.00"
+
+
+def test_amounts_tag_converts_prices():
+    template = Template(
+        '{% load prices %}{% amounts prices currency="EUR" as rows %}'
+        "{% for value, price in rows %}{{ price }};{% endfor %}"
+    )
+    context = Context({"prices": [Money("10", "USD"), Money("4", "PLN")]})
+    assert template.render(context) == "€5.00;€0.50;"
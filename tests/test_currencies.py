@@ -0,0 +1,58 @@
+# coding: utf-8
+from decimal import Decimal
+
+import pytest
+from babel.numbers import get_currency_precision
+
+from django_prices.utils.currencies import (
+    exceeds_precision,
+    get_currency_info,
+    get_currency_symbol,
+    get_currency_table,
+    is_currency,
+)
+
+
+def test_currency_table_is_built_once_and_immutable():
+    table = get_currency_table()
+    assert get_currency_table() is table
+    with pytest.raises(TypeError):
+        table["XXX"] = None
+
+
+@pytest.mark.parametrize("code", ["USD", "JPY", "BHD", "CHF", "EUR"])
+def test_currency_info_matches_babel(code):
+    info = get_currency_info(code)
+    assert info.known
+    assert info.precision == get_currency_precision(code)
+
+
+def test_unknown_currency_info_uses_default_fraction():
+    info = get_currency_info("BTC")
+    assert not info.known
+    assert info.precision == 2
+    assert not is_currency("BTC")
+    assert not is_currency(None)
+    assert is_currency("USD")
+
+
+def test_currency_symbol_is_localized():
+    assert get_currency_symbol("USD", "en_US") == "$"
+    assert get_currency_symbol("USD", "zh_Hans_CN") == "US$"
+
+
+@pytest.mark.parametrize(
+    "amount,precision,expected",
+    [
+        ("5", 2, False),
+        ("5.1", 2, False),
+        ("5.10", 2, False),
+        ("5.001", 2, True),
+        ("5E+2", 0, False),
+        ("5.5", 0, True),
+        ("NaN", 2, False),
+        ("Infinity", 2, False),
+    ],
+)
+def test_exceeds_precision(amount, precision, expected):
+    assert exceeds_precision(Decimal(amount), precision) is expected
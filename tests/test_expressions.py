@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import FieldError
+from django.db.models import Max, Sum
+from prices import Money, TaxedMoney
+
+from django_prices.expressions import TaxAmount, TaxRate
+
+from .models import Model
+
+
+def taxed(net, gross, currency="USD"):
+    return TaxedMoney(Money(net, currency), Money(gross, currency))
+
+
+@pytest.fixture
+def taxed_prices(db):
+    Model.objects.create(price=taxed("10", "12.30"))
+    Model.objects.create(price=taxed("100", "108"))
+    Model.objects.create(price=taxed("0", "0", "BTC"))
+
+
+def test_annotate_tax_amount(taxed_prices):
+    rows = Model.objects.annotate(tax=TaxAmount("price")).order_by("pk")
+    assert [row.tax for row in rows] == [Decimal("2.30"), Decimal("8"), Decimal("0")]
+
+
+def test_annotate_tax_rate(taxed_prices):
+    rows = Model.objects.annotate(rate=TaxRate("price")).order_by("pk")
+    rates = [row.rate for row in rows]
+    assert rates[0] == pytest.approx(Decimal("0.23"))
+    assert rates[1] == pytest.approx(Decimal("0.08"))
+    assert rates[2] is None
+
+
+def test_filter_and_order_by_tax_rate(taxed_prices):
+    queryset = Model.objects.annotate(rate=TaxRate("price"))
+    assert queryset.filter(rate__gt=Decimal("0.1")).count() == 1
+    ordered = Model.objects.exclude(currency="BTC").order_by(TaxRate("price"))
+    assert [row.price for row in ordered] == [taxed("100", "108"), taxed("10", "12.30")]
+
+
+def test_aggregate_tax_amount(taxed_prices):
+    totals = Model.objects.filter(currency="USD").aggregate(
+        total=Sum(TaxAmount("price")), highest=Max(TaxAmount("price"))
+    )
+    assert totals == {"total": Decimal("10.30"), "highest": Decimal("8")}
+
+
+def test_expression_requires_taxed_money_field(db):
+    with pytest.raises(FieldError):
+        list(Model.objects.annotate(tax=TaxAmount("price_net")))
@@ -1,5 +1,6 @@
 # coding: utf-8
 import pytest
+from django.utils import translation
 from django_prices import forms, widgets
 from prices import Money
 
@@ -201,3 +202,69 @@ def test_min_money_is_validated_for_many_currencies():
 def test_value_error_is_raised_when_no_currencies_are_configured():
     with pytest.raises(ValueError):
         forms.MoneyField(available_currencies=[])
+
+
+def test_currency_choices_are_cached_per_locale(monkeypatch):
+    forms._build_currency_choices.cache_clear()
+    calls = []
+    get_currency_symbol = forms.get_currency_symbol
+
+    def counting_get_currency_symbol(code, locale_code):
+        calls.append((code, locale_code))
+        return get_currency_symbol(code, locale_code)
+
+    monkeypatch.setattr(forms, "get_currency_symbol", counting_get_currency_symbol)
+    with translation.override("en"):
+        first = forms.MoneyField(available_currencies=AVAILABLE_CURRENCIES)
+        second = forms.MoneyField(available_currencies=AVAILABLE_CURRENCIES)
+    assert len(calls) == len(AVAILABLE_CURRENCIES)
+    assert first.fields[1].choices == second.fields[1].choices
+    with translation.override("zh-hans"):
+        forms.MoneyField(available_currencies=AVAILABLE_CURRENCIES)
+    assert len(calls) == 2 * len(AVAILABLE_CURRENCIES)
+
+
+def test_currency_choices_are_shared_by_field_and_widget():
+    field = forms.MoneyField(available_currencies=AVAILABLE_CURRENCIES)
+    assert field.fields[1].choices is field.widget.widgets[1].choices
+    assert forms._get_currency_choices(AVAILABLE_CURRENCIES) is (
+        forms._get_currency_choices(list(AVAILABLE_CURRENCIES))
+    )
+
+
+def test_form_instances_share_currency_choices():
+    first = RequiredPriceForm()
+    second = RequiredPriceForm()
+    first_field = first.fields["price_net"]
+    second_field = second.fields["price_net"]
+    assert first_field is not second_field
+    assert first_field.fields[1] is not second_field.fields[1]
+    assert first_field.fields[1].choices is second_field.fields[1].choices
+    assert first_field.widget is not second_field.widget
+    assert first_field.widget.widgets[1].choices is first_field.fields[1].choices
+    assert second_field.widget.widgets[1].choices is first_field.fields[1].choices
+
+
+def test_form_instance_choices_can_be_replaced_independently():
+    first = RequiredPriceForm()
+    second = RequiredPriceForm()
+    first.fields["price_net"].fields[1].choices = [("USD", "$")]
+    assert len(second.fields["price_net"].fields[1].choices) == 2
+    form = RequiredPriceForm(data={"price_net_0": "20", "price_net_1": "BTC"})
+    assert form.is_valid()
+
+
+@pytest.mark.parametrize(
+    "value,currency",
+    [(Money(5, "BTC"), "BTC"), (None, "BTC"), (Money(5, "<b>"), "<b>")],
+)
+def test_fixed_currency_money_input_renders_same_html_without_template(value, currency):
+    attrs = {"key": "value"}
+    widget = widgets.FixedCurrencyMoneyInput(currency=currency, attrs=attrs)
+    fast_widget = widgets.FixedCurrencyMoneyInput(
+        currency=currency, attrs=attrs, use_template=False
+    )
+    expected = widget.render("price", value, attrs={"foo": "bar"})
+    result = fast_widget.render("price", value, attrs={"foo": "bar"})
+    assert result == expected
+    assert type(result) is type(expected)
@@ -0,0 +1,39 @@
+# coding: utf-8
+import subprocess
+import sys
+
+# Modules which importing django_prices.models may add on top of what
+# Django's ORM and the prices package import on their own
+ALLOWED_MODEL_IMPORTS = {
+    "django_prices",
+    "django_prices.instrumentation",
+    "django_prices.models",
+    "django_prices.utils",
+    "django_prices.utils.currencies",
+}
+
+
+def get_imported_modules(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        modules.add(line.split("|")[-1].strip())
+    return modules
+
+
+def test_models_import_does_not_get_heavier():
+    baseline = get_imported_modules("import django.db.models, prices")
+    imported = get_imported_modules("import django_prices.models")
+    assert imported - baseline <= ALLOWED_MODEL_IMPORTS
+
+
+def test_templatetags_do_not_import_enmerkar():
+    imported = get_imported_modules("import django_prices.templatetags.prices")
+    assert "enmerkar" not in imported
@@ -0,0 +1,70 @@
+# coding: utf-8
+import pytest
+from prices import Money
+
+import django_prices
+from django_prices import instrumentation
+from django_prices.templatetags import prices
+from django_prices.validators import MaxMoneyValidator, MoneyPrecisionValidator
+
+
+@pytest.fixture
+def enabled_instrumentation():
+    instrumentation.enable()
+    django_prices.reset_stats()
+    yield
+    instrumentation.disable()
+    django_prices.reset_stats()
+
+
+def test_disabled_instrumentation_records_nothing():
+    django_prices.reset_stats()
+    prices.amount(Money("10", "USD"))
+    assert django_prices.stats()["operations"] == {}
+
+
+def test_stats_count_calls_and_time(enabled_instrumentation):
+    prices.amount(Money("10", "USD"))
+    prices.amount(Money("10", "USD"), "html")
+    MoneyPrecisionValidator(9, 2)(Money("10", "USD"))
+    MaxMoneyValidator(Money(15, "USD"))(Money("10", "USD"))
+
+    operations = django_prices.stats()["operations"]
+    assert operations["amount"]["calls"] == 2
+    assert operations["format_price"]["calls"] == 2
+    assert operations["get_locale_data"]["calls"] == 2
+    assert operations["MoneyPrecisionValidator"]["calls"] == 1
+    assert operations["MoneyValueValidator"]["calls"] == 1
+    assert operations["amount"]["time"] >= operations["format_price"]["time"] > 0
+
+
+def test_stats_report_cache_hit_rates(enabled_instrumentation):
+    for _ in range(3):
+        prices.amount(Money("10", "USD"))
+    caches = django_prices.stats()["caches"]
+    assert caches["output"]["hits"] + caches["output"]["misses"] == 3
+    assert caches["locale"]["hits"] + caches["locale"]["misses"] == 3
+    assert caches["output"]["hit_rate"] >= 2 / 3
+
+
+def test_reset_stats(enabled_instrumentation):
+    prices.amount(Money("10", "USD"))
+    django_prices.reset_stats()
+    snapshot = django_prices.stats()
+    assert snapshot["operations"] == {}
+    assert snapshot["caches"]["formatter"]["hits"] == 0
+    assert snapshot["caches"]["formatter"]["misses"] == 0
+
+
+def test_operation_recorded_signal(enabled_instrumentation):
+    recorded = []
+
+    def receiver(sender, name, duration, **kwargs):
+        recorded.append(name)
+
+    instrumentation.operation_recorded.connect(receiver)
+    try:
+        prices.amount(Money("10", "USD"))
+    finally:
+        instrumentation.operation_recorded.disconnect(receiver)
+    assert recorded == ["get_locale_data", "format_price", "amount"]
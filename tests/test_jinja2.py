@@ -0,0 +1,49 @@
+# coding: utf-8
+import functools
+
+import pytest
+from django.template import Context, Template
+from prices import Money, TaxedMoney, percentage_discount
+
+jinja2 = pytest.importorskip("jinja2")
+
+from django_prices.jinja2 import PricesExtension  # noqa: E402
+
+
+@pytest.fixture
+def environment():
+    return jinja2.Environment(autoescape=True, extensions=[PricesExtension])
+
+
+@pytest.mark.parametrize("format", ["text", "html", "other"])
+def test_amount_filter_matches_django(environment, format):
+    context = {"price": Money("1234.5", "USD"), "format": format}
+    django_result = Template("{% load prices %}{{ price|amount:format }}").render(
+        Context(context)
+    )
+    jinja_result = environment.from_string("{{ price|amount(format) }}").render(context)
+    assert jinja_result == django_result
+
+
+def test_amount_global(environment):
+    result = environment.from_string("{{ amount(price, 'html') }}").render(
+        price=Money("10", "USD")
+    )
+    assert result == '<span class="currency">$</span>10.00'
+
+
+def test_discount_amount_for_filter(environment):
+    price = TaxedMoney(Money(30, "USD"), Money(30, "USD"))
+    discount = functools.partial(percentage_discount, percentage=50)
+    result = environment.from_string(
+        "{{ (discount|discount_amount_for(price)).gross|amount }}"
+    ).render(price=price, discount=discount)
+    assert result == "-$15.00"
+
+
+def test_amounts_global(environment):
+    result = environment.from_string(
+        "{% for item, price in amounts(items, 'html', 'gross') %}{{ price }};"
+        "{% endfor %}"
+    ).render(items=[TaxedMoney(Money(10, "USD"), Money(12, "USD"))])
+    assert result == '<span class="currency">$</span>12.00;'
@@ -0,0 +1,149 @@
+# coding: utf-8
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from django.apps import apps
+from django.db import connection
+from django.db.migrations.state import ProjectState
+from django.db.migrations.writer import OperationWriter
+from django.db.models import Avg
+from prices import Money
+
+from django_prices.operations import ConvertFromMinorUnits, ConvertToMinorUnits
+from django_prices.utils.currencies import from_minor_units, to_minor_units
+
+from .models import MinorUnitsModel
+
+
+@pytest.mark.parametrize(
+    "amount,currency,minor_units",
+    [
+        ("10.99", "USD", 1099),
+        ("10", "USD", 1000),
+        ("1500", "JPY", 1500),
+        ("1.5", "BHD", 1500),
+    ],
+)
+def test_minor_units_conversion(amount, currency, minor_units):
+    assert to_minor_units(Decimal(amount), currency) == minor_units
+    assert from_minor_units(minor_units, currency) == Decimal(amount)
+
+
+def test_to_minor_units_rejects_extra_decimal_places():
+    with pytest.raises(ValueError):
+        to_minor_units(Decimal("10.999"), "USD")
+    with pytest.raises(ValueError):
+        to_minor_units(Decimal("10.5"), "JPY")
+
+
+def test_minor_units_field_get_and_set():
+    instance = MinorUnitsModel()
+    assert instance.price == Money("5.00", "USD")
+    instance.price = Money("12.34", "USD")
+    assert instance.price_minor_units == 1234
+    assert instance.price == Money("12.34", "USD")
+    instance.price = Money("1200", "JPY")
+    assert instance.price_minor_units == 1200
+    assert instance.price == Money("1200", "JPY")
+
+
+def test_minor_units_field_default():
+    field = MinorUnitsModel._meta.get_field("price")
+    assert field.get_default() == Money("5", "USD")
+
+
+def test_minor_units_field_database_roundtrip(db):
+    MinorUnitsModel.objects.create(price=Money("12.34", "USD"))
+    instance = MinorUnitsModel.objects.get()
+    assert instance.price == Money("12.34", "USD")
+
+
+def test_minor_units_field_lookups_and_aggregates(db):
+    MinorUnitsModel.objects.create(price=Money("10.50", "USD"))
+    MinorUnitsModel.objects.create(price=Money("2.25", "USD"))
+    assert MinorUnitsModel.objects.filter(price__gt=Money("10.49", "USD")).count() == 1
+    assert MinorUnitsModel.objects.filter(price=Money("2.25", "USD")).count() == 1
+    assert MinorUnitsModel.objects.aggregate_money("price") == {
+        "USD": Money("12.75", "USD")
+    }
+    average = MinorUnitsModel.objects.aggregate_money("price", Avg)["USD"]
+    assert average == Money("6.375", "USD")
+
+
+@pytest.fixture
+def state():
+    return ProjectState.from_apps(apps)
+
+
+@pytest.fixture
+def schema_editor():
+    # Data operations only use the connection of the schema editor
+    return SimpleNamespace(connection=connection)
+
+
+def test_convert_to_minor_units_operation(db, state, schema_editor):
+    MinorUnitsModel.objects.create(price_amount=Decimal("10.99"), currency="USD")
+    MinorUnitsModel.objects.create(price_amount=Decimal("1500"), currency="JPY")
+    MinorUnitsModel.objects.create(price_amount=None, currency="USD")
+    operation = ConvertToMinorUnits(
+        "tests.MinorUnitsModel",
+        amount_field="price_amount",
+        minor_units_field="price_minor_units",
+        currency_field="currency",
+        batch_size=1,
+    )
+    operation.database_forwards("tests", schema_editor, state, state)
+    assert list(
+        MinorUnitsModel.objects.order_by("pk").values_list(
+            "price_minor_units", flat=True
+        )
+    ) == [1099, 1500, 500]
+
+    MinorUnitsModel.objects.update(price_amount=None)
+    operation.database_backwards("tests", schema_editor, state, state)
+    assert list(
+        MinorUnitsModel.objects.order_by("pk").values_list("price_amount", flat=True)
+    ) == [Decimal("10.99"), Decimal("1500"), Decimal("5")]
+
+
+def test_convert_from_minor_units_operation(db, state, schema_editor):
+    MinorUnitsModel.objects.create(price=Money("10.99", "USD"))
+    operation = ConvertFromMinorUnits(
+        "tests.MinorUnitsModel",
+        minor_units_field="price_minor_units",
+        amount_field="price_amount",
+        currency_field="currency",
+    )
+    operation.database_forwards("tests", schema_editor, state, state)
+    assert MinorUnitsModel.objects.get().price_amount == Decimal("10.99")
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        ConvertToMinorUnits(
+            "tests.MinorUnitsModel",
+            amount_field="price_amount",
+            minor_units_field="price_minor_units",
+            currency_field="currency",
+        ),
+        ConvertFromMinorUnits(
+            "tests.MinorUnitsModel",
+            minor_units_field="price_minor_units",
+            amount_field="price_amount",
+            currency_field="currency",
+            batch_size=10,
+            numeric_currency=True,
+        ),
+    ],
+)
+def test_minor_units_operations_serialize_in_migrations(operation):
+    source, imports = OperationWriter(operation, indentation=0).serialize()
+    namespace = {}
+    exec("\n".join(sorted(imports)), namespace)
+    restored = eval(source.rstrip(","), namespace)
+    assert type(restored) is type(operation)
+    assert restored.deconstruct() == operation.deconstruct()
+    assert restored.describe() == operation.describe()
+    assert restored.numeric_currency == operation.numeric_currency
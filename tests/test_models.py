@@ -3,11 +3,18 @@ from decimal import Decimal
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db.migrations.state import ModelState
 from django.db.models.fields import DecimalField
 from django_prices import forms, widgets, models
 from prices import Money, TaxedMoney
 
-from .models import Model, NullModel
+from .models import (
+    CachedModel,
+    IndexedModel,
+    InheritedCallableDefaultModel,
+    Model,
+    NullModel,
+)
 
 
 def test_money_field_instance_init_by_money_object():
@@ -182,3 +189,106 @@ def test_compare_taxed_money_field_with_money_field():
     assert not field_1 > field_2
     field_2.creation_counter -= 1
     assert field_1 == field_2
+
+
+def test_money_field_builds_new_object_on_every_access_by_default():
+    instance = Model()
+    assert instance.price_net is not instance.price_net
+    assert instance.price is not instance.price
+
+
+def test_cached_money_field_reuses_object():
+    instance = CachedModel()
+    assert instance.price_net is instance.price_net
+    assert instance.price is instance.price
+
+
+def test_cached_money_field_invalidated_by_amount_assignment():
+    instance = CachedModel()
+    price_net = instance.price_net
+    instance.price_net_amount = Decimal("7")
+    assert instance.price_net == Money(7, "BTC")
+    assert instance.price.net == Money(7, "BTC")
+    instance.currency = "USD"
+    assert instance.price_net == Money(7, "USD")
+    assert instance.price_net is not price_net
+
+
+def test_cached_money_field_invalidated_by_set():
+    instance = CachedModel()
+    assert instance.price_net == Money(5, "BTC")
+    instance.price_net = Money(10, "USD")
+    assert instance.price_net == Money(10, "USD")
+    instance.price = TaxedMoney(Money(1, "BTC"), Money(2, "BTC"))
+    assert instance.price == TaxedMoney(Money(1, "BTC"), Money(2, "BTC"))
+
+
+def test_cached_money_field_invalidated_by_refresh_from_db(db):
+    instance = CachedModel.objects.create()
+    assert instance.price_net == Money(5, "BTC")
+    CachedModel.objects.update(price_net_amount=Decimal("8"), currency="USD")
+    instance.refresh_from_db()
+    assert instance.price_net == Money(8, "USD")
+    assert instance.price.net == Money(8, "USD")
+
+
+def test_default_money_is_resolved_without_meta_lookups(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("_meta lookup on access")
+
+    field = Model._meta.get_field("price_net")
+    monkeypatch.setattr(Model._meta, "get_field", fail)
+    assert field.get_default() == Money(Model.DEFAULT_NET, Model.DEFAULT_CURRENCY)
+    assert field.formfield()
+
+
+def test_null_default_is_resolved_without_meta_lookups(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("_meta lookup on access")
+
+    instance = NullModel()
+    monkeypatch.setattr(NullModel._meta, "get_field", fail)
+    assert instance.price_net is None
+
+
+def test_shared_default_money_is_immutable():
+    field = Model._meta.get_field("price_net")
+    default = field.get_default()
+    assert default is field.get_default()
+    assert default == Money(Model.DEFAULT_NET, Model.DEFAULT_CURRENCY)
+    with pytest.raises(AttributeError):
+        default.amount = Decimal(10)
+
+
+def test_money_field_formfield_uses_currency_codes():
+    form_field = Model.price_net.formfield()
+    assert [code for code, _ in form_field.fields[1].choices] == ["BTC", "USD"]
+
+
+def test_money_fields_without_db_index_add_no_indexes():
+    assert Model._meta.indexes == []
+
+
+def test_money_fields_with_db_index_add_composite_indexes():
+    indexes = IndexedModel._meta.indexes
+    # The net amount index is shared by MoneyField and TaxedMoneyField
+    assert [index.fields for index in indexes] == [
+        ["currency", "price_net_amount"],
+        ["currency", "price_gross_amount"],
+    ]
+    assert all(index.name for index in indexes)
+
+
+def test_money_field_indexes_are_visible_to_migrations():
+    state = ModelState.from_model(IndexedModel)
+    assert [index.fields for index in state.options["indexes"]] == [
+        ["currency", "price_net_amount"],
+        ["currency", "price_gross_amount"],
+    ]
+
+
+def test_money_field_inherited_from_abstract_model_with_callable_default():
+    assert InheritedCallableDefaultModel().price == Money("7", "USD")
+    assert InheritedCallableDefaultModel(price_amount=None).price == Money("7", "USD")
+    field = InheritedCallableDefaultModel._meta.get_field("price")
+    assert field.get_available_currencies() == []
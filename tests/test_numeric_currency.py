@@ -0,0 +1,64 @@
+# coding: utf-8
+from decimal import Decimal
+
+import pytest
+from prices import Money, TaxedMoney
+
+from django_prices.utils.currencies import get_currency_code, get_currency_number
+
+from .models import NumericCurrencyModel
+
+
+def test_currency_number_conversion():
+    assert get_currency_number("USD") == 840
+    assert get_currency_number("ALL") == 8
+    assert get_currency_code(978) == "EUR"
+    with pytest.raises(ValueError):
+        get_currency_number("BTC")
+    with pytest.raises(ValueError):
+        get_currency_code(1)
+
+
+def test_numeric_currency_field_get_and_set():
+    instance = NumericCurrencyModel()
+    assert instance.price_net == Money("5", "USD")
+    instance.price_net = Money("10", "EUR")
+    assert instance.currency == 978
+    assert instance.price_net == Money("10", "EUR")
+    instance.price = TaxedMoney(Money("10", "USD"), Money("12", "USD"))
+    assert instance.currency == 840
+    assert instance.price == TaxedMoney(Money("10", "USD"), Money("12", "USD"))
+
+
+def test_numeric_currency_field_rejects_unknown_currency():
+    instance = NumericCurrencyModel()
+    with pytest.raises(ValueError):
+        instance.price_net = Money("10", "BTC")
+
+
+def test_numeric_currency_field_default_and_choices():
+    field = NumericCurrencyModel._meta.get_field("price_net")
+    assert field.get_default() == Money("5", "USD")
+    assert field.get_available_currencies() == ["USD", "EUR"]
+    assert field.formfield().fields[1].choices == [("USD", "$"), ("EUR", "€")]
+
+
+def test_numeric_currency_field_is_indexed():
+    indexes = [index.fields for index in NumericCurrencyModel._meta.indexes]
+    assert ["currency", "price_net_amount"] in indexes
+
+
+def test_numeric_currency_lookups_and_aggregates(db):
+    NumericCurrencyModel.objects.create(price_net=Money("10", "EUR"))
+    NumericCurrencyModel.objects.create(price_net=Money("20", "EUR"))
+    NumericCurrencyModel.objects.create(price_net=Money("3", "USD"))
+    queryset = NumericCurrencyModel.objects.all()
+    assert queryset.filter(price_net__gt=Money("5", "EUR")).count() == 2
+    assert queryset.filter(price__net__lt=Money("5", "USD")).count() == 1
+    assert queryset.aggregate_money("price_net") == {
+        "EUR": Money("30", "EUR"),
+        "USD": Money("3", "USD"),
+    }
+    assert queryset.aggregate_money("price")["USD"] == TaxedMoney(
+        Money("3", "USD"), Money(Decimal("5"), "USD")
+    )
@@ -0,0 +1,125 @@
+# coding: utf-8
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import FieldError
+from django.db.models import Avg, Exists, Max, OuterRef, Q, Sum
+from prices import Money, TaxedMoney
+
+from django_prices.query import aggregate_money
+
+from .models import Model, NullModel
+
+
+@pytest.fixture
+def prices_in_two_currencies(db):
+    Model.objects.create(price_net=Money("10", "USD"), price_gross=Money("12", "USD"))
+    Model.objects.create(
+        price_net=Money("5.50", "USD"), price_gross=Money("6.50", "USD")
+    )
+    Model.objects.create(price_net=Money("1", "BTC"), price_gross=Money("2", "BTC"))
+
+
+def test_aggregate_money_field_groups_by_currency(prices_in_two_currencies):
+    assert Model.objects.aggregate_money("price_net") == {
+        "USD": Money("15.50", "USD"),
+        "BTC": Money("1", "BTC"),
+    }
+
+
+def test_aggregate_money_field_with_custom_function(prices_in_two_currencies):
+    assert Model.objects.aggregate_money("price_gross", Max) == {
+        "USD": Money("12", "USD"),
+        "BTC": Money("2", "BTC"),
+    }
+
+
+def test_aggregate_taxed_money_field(prices_in_two_currencies):
+    totals = Model.objects.filter(currency="USD").aggregate_money("price")
+    assert totals == {"USD": TaxedMoney(Money("15.50", "USD"), Money("18.50", "USD"))}
+
+
+def test_average_taxed_money_field(prices_in_two_currencies):
+    totals = Model.objects.filter(currency="USD").aggregate_money("price", Avg)
+    assert totals == {"USD": TaxedMoney(Money("7.75", "USD"), Money("9.25", "USD"))}
+
+
+def test_aggregate_taxed_money_field_rejects_non_additive_functions(db):
+    with pytest.raises(TypeError):
+        Model.objects.aggregate_money("price", Max)
+
+
+def test_aggregate_money_skips_null_amounts(db):
+    NullModel.objects.create(price_net_amount=Decimal("3"), currency="USD")
+    NullModel.objects.create(currency="BTC")
+    assert aggregate_money(NullModel.objects.all(), "price_net", Sum) == {
+        "USD": Money("3", "USD")
+    }
+
+
+def test_aggregate_money_runs_single_grouped_query(
+    prices_in_two_currencies, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        Model.objects.aggregate_money("price_net")
+
+
+def test_aggregate_money_rejects_other_fields(db):
+    with pytest.raises(TypeError):
+        Model.objects.aggregate_money("currency")
+
+
+def test_filter_by_money_field(prices_in_two_currencies):
+    assert Model.objects.filter(price_net__gte=Money("6", "USD")).count() == 1
+    assert Model.objects.filter(price_net__lte=Money("6", "USD")).count() == 1
+    assert Model.objects.filter(price_net=Money("1", "BTC")).count() == 1
+    assert Model.objects.exclude(price_net__gt=Money("0", "BTC")).count() == 2
+
+
+def test_filter_by_taxed_money_field_parts(prices_in_two_currencies):
+    assert Model.objects.filter(price__gross__lt=Money("7", "USD")).count() == 1
+    assert Model.objects.filter(price__net__gt=Money("0", "BTC")).count() == 1
+    price = TaxedMoney(Money("10", "USD"), Money("12", "USD"))
+    assert Model.objects.filter(price=price).count() == 1
+
+
+def test_money_lookups_in_q_objects(prices_in_two_currencies):
+    lookup = Q(price_net=Money("1", "BTC")) | Q(price_gross__gt=Money("10", "USD"))
+    assert Model.objects.filter(lookup).count() == 2
+
+
+def test_get_by_money_field(prices_in_two_currencies):
+    instance = Model.objects.get(price_net=Money("10", "USD"))
+    assert instance.price_gross == Money("12", "USD")
+
+
+def test_filter_by_null_money_field(db):
+    NullModel.objects.create(currency="BTC")
+    assert NullModel.objects.filter(price_net=None).count() == 1
+
+
+def test_money_lookup_sql_puts_currency_predicate_first():
+    sql = str(Model.objects.filter(price_net__gte=Money("10", "USD")).query)
+    where = sql[sql.index("WHERE") :]
+    assert where.index('"currency" = USD') < where.index('"price_net_amount" >= 10')
+
+    sql = str(Model.objects.filter(price__gross__lt=Money("10", "USD")).query)
+    where = sql[sql.index("WHERE") :]
+    assert where.index('"currency" = USD') < where.index('"price_gross_amount" < 10')
+
+
+def test_unsupported_money_lookups():
+    with pytest.raises(FieldError):
+        Model.objects.filter(price_net__contains=Money("10", "USD"))
+    with pytest.raises(FieldError):
+        Model.objects.filter(price__tax=Money("10", "USD"))
+    with pytest.raises(TypeError):
+        Model.objects.filter(price_net__gt=10)
+
+
+def test_money_lookups_with_conditional_expressions(prices_in_two_currencies):
+    exists = Exists(Model.objects.filter(pk=OuterRef("pk")))
+    assert Model.objects.filter(Q(exists)).count() == 3
+    lookup = Q(price_net__gte=Money("6", "USD")) | ~exists
+    assert Model.objects.filter(lookup).count() == 1
+    assert Model.objects.filter(lookup, exists).count() == 1
@@ -0,0 +1,66 @@
+# coding: utf-8
+import json
+from decimal import Decimal
+
+import pytest
+from prices import Money, TaxedMoney
+
+from django_prices import serializers
+
+from .models import Model
+
+PRICE = TaxedMoney(Money("10.50", "USD"), Money("12.92", "USD"))
+
+
+def test_json_encoder_round_trip():
+    data = {"price": PRICE, "total": Money("1.10", "EUR"), "other": {"net": 1}}
+    encoded = json.dumps(data, cls=serializers.MoneyJSONEncoder)
+    assert json.loads(encoded)["total"] == {"amount": "1.10", "currency": "EUR"}
+    decoded = json.loads(encoded, object_hook=serializers.decode_money)
+    assert decoded == data
+    assert decoded["total"].amount == Decimal("1.10")
+
+
+def test_encode_money_rejects_other_types():
+    with pytest.raises(TypeError):
+        serializers.encode_money(Decimal("1"))
+
+
+def test_money_list_with_one_currency():
+    values = [Money("1.5", "USD"), None, Money("3", "USD")]
+    encoded = serializers.encode_money_list(values)
+    assert encoded == {"currencies": ["USD"], "amounts": ["1.5", None, "3"]}
+    assert serializers.decode_money_list(json.loads(json.dumps(encoded))) == values
+
+
+def test_money_list_with_many_currencies():
+    values = [Money("1", "USD"), Money("2", "EUR"), Money("3", "USD")]
+    encoded = serializers.encode_money_list(values)
+    assert encoded["currencies"] == ["USD", "EUR"]
+    assert encoded["index"] == [0, 1, 0]
+    assert serializers.decode_money_list(encoded) == values
+    assert serializers.decode_money_list(serializers.encode_money_list([])) == []
+
+
+def test_orjson_round_trip():
+    pytest.importorskip("orjson")
+    data = [PRICE, {"total": Money("3", "PLN")}]
+    assert serializers.orjson_loads(serializers.orjson_dumps(data)) == data
+
+
+def test_msgpack_round_trip():
+    pytest.importorskip("msgpack")
+    data = [PRICE, {"total": Money("3", "PLN")}]
+    assert serializers.msgpack_loads(serializers.msgpack_dumps(data)) == data
+
+
+def test_django_serializer_round_trip(db):
+    instance = Model.objects.create(price=PRICE)
+    data = serializers.Serializer().serialize(Model.objects.all())
+    fields = json.loads(data)[0]["fields"]
+    assert fields["price"] == serializers.encode_money(PRICE)
+    assert fields["price_net"] == {"amount": "10.50", "currency": "USD"}
+    Model.objects.all().delete()
+    for deserialized in serializers.Deserializer(data):
+        deserialized.save()
+    assert Model.objects.get(pk=instance.pk).price == PRICE
@@ -1,10 +1,24 @@
 # coding: utf-8
+import asyncio
 import functools
+import threading
+from decimal import Decimal
 
 import pytest
+from django.template import Context, Template
 from django.utils import translation
+from django.utils.safestring import SafeString
 from django_prices.templatetags import prices
-from django_prices.utils.formatting import get_currency_fraction
+from django_prices.utils import locale as locale_utils
+from django_prices.utils.formatting import (
+    clear_output_cache,
+    format_price,
+    format_prices,
+    get_currency_fraction,
+    get_formatter,
+    get_output_cache,
+    output_backend_cache_info,
+)
 
 from prices import Money, TaxedMoney, percentage_discount
 
@@ -86,3 +100,197 @@ def test_get_currency_fraction_unknown_currency():
 def test_format_price_invalid_value():
     result = prices.format_price("invalid", "USD")
     assert result == ""
+
+
+def test_formatter_is_cached_per_locale_currency_and_output():
+    get_formatter.cache_clear()
+    formatter = get_formatter("en_US", "USD", False)
+    assert get_formatter("en_US", "USD", False) is formatter
+    assert get_formatter("en_US", "USD", True) is not formatter
+    assert get_formatter("pl_PL", "USD", False) is not formatter
+    info = get_formatter.cache_info()
+    assert info.hits == 1
+    assert info.misses == 3
+
+
+def test_formatter_renders_quantized_amount():
+    formatter = get_formatter("en_US", "USD", True)
+    assert formatter(Decimal("10.006")) == '<span class="currency">$</span>10.01'
+    assert get_formatter("en_US", "JPY", False)(Decimal("10.5")) == "\xa510"
+
+
+def test_locale_data_is_memoized_per_active_language(monkeypatch):
+    locale_utils.clear_locale_cache()
+    calls = []
+    parse = locale_utils.Locale.parse
+
+    def counting_parse(identifier, *args, **kwargs):
+        calls.append(identifier)
+        return parse(identifier, *args, **kwargs)
+
+    monkeypatch.setattr(locale_utils.Locale, "parse", counting_parse)
+    with translation.override("de"):
+        assert locale_utils.get_locale_data()[1] == "de"
+        assert locale_utils.get_locale_data()[1] == "de"
+    with translation.override("pl"):
+        assert locale_utils.get_locale_data()[1] == "pl"
+    with translation.override("de"):
+        assert locale_utils.get_locale_data()[1] == "de"
+    assert calls == ["de", "pl"]
+
+
+def test_unknown_locale_is_negatively_cached(monkeypatch, settings):
+    locale_utils.clear_locale_cache()
+    settings.LANGUAGE_CODE = "en_US"
+    calls = []
+    parse = locale_utils.Locale.parse
+
+    def counting_parse(identifier, *args, **kwargs):
+        calls.append(identifier)
+        return parse(identifier, *args, **kwargs)
+
+    monkeypatch.setattr(locale_utils.Locale, "parse", counting_parse)
+    with translation.override("zz"):
+        assert locale_utils.get_locale_data()[1] == "en_US"
+        assert locale_utils.get_locale_data()[1] == "en_US"
+    assert calls == ["zz", "en_US"]
+
+
+def test_format_prices_matches_format_price():
+    values = [Money("10", "USD"), Money("5.5", "BTC"), Money("1234.567", "USD")]
+    for html in (False, True):
+        expected = [
+            format_price(value.amount, value.currency, html=html) for value in values
+        ]
+        assert format_prices(values, html=html) == expected
+
+
+def test_format_prices_resolves_locale_once(monkeypatch):
+    calls = []
+    get_locale_data = locale_utils.get_locale_data
+
+    def counting_get_locale_data(language=None):
+        calls.append(1)
+        return get_locale_data(language)
+
+    monkeypatch.setattr(
+        "django_prices.utils.formatting.get_locale_data", counting_get_locale_data
+    )
+    format_prices([Money("10", "USD")] * 10)
+    assert len(calls) == 1
+
+
+def test_templatetag_amounts():
+    price = TaxedMoney(Money(10, "USD"), Money(12, "USD"))
+    template = Template(
+        "{% load prices %}"
+        '{% amounts items "html" attr="gross" as rows %}'
+        "{% for item, price in rows %}{{ price }};{% endfor %}"
+    )
+    result = template.render(Context({"items": [price, price]}))
+    assert result == ('<span class="currency">$</span>12.00;' * 2)
+
+
+def test_templatetag_amounts_for_money_list(money_fixture):
+    rows = prices.amounts([money_fixture, Money("5", "USD")])
+    assert rows == [(money_fixture, "$10.00"), (Money("5", "USD"), "$5.00")]
+
+
+def test_formatted_prices_are_memoized():
+    clear_output_cache()
+    first = format_price(Decimal("9.99"), "USD", html=True)
+    second = format_price(Decimal("9.99"), "USD", html=True)
+    assert second is first
+    assert isinstance(second, SafeString)
+    assert format_price(Decimal("9.99"), "USD") == "$9.99"
+    with translation.override("de"):
+        assert format_price(Decimal("9.99"), "USD") == "9,99\xa0$"
+    info = get_output_cache().cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+
+
+def test_memoized_prices_keep_sign_of_zero():
+    assert format_price(Decimal("0"), "USD") == "$0.00"
+    assert format_price(Decimal("-0"), "USD") == "-$0.00"
+
+
+def test_output_cache_size_setting(settings):
+    settings.PRICES_FORMAT_CACHE_SIZE = 2
+    assert get_output_cache().cache_info().maxsize == 2
+    settings.PRICES_FORMAT_CACHE_SIZE = 0
+    format_price(Decimal("9.99"), "USD")
+    assert get_output_cache().cache_info().currsize == 0
+
+
+def test_output_cache_backend(settings):
+    settings.PRICES_FORMAT_CACHE_BACKEND = "default"
+    assert format_price(Decimal("19.99"), "USD", html=True) == (
+        '<span class="currency">$</span>19.99'
+    )
+    # Drop the in-process cache, the price comes from the cache backend
+    clear_output_cache()
+    result = format_price(Decimal("19.99"), "USD", html=True)
+    assert isinstance(result, SafeString)
+    assert result == '<span class="currency">$</span>19.99'
+    assert output_backend_cache_info().hits == 1
+
+
+def test_format_price_with_explicit_locale():
+    with translation.override("en"):
+        assert format_price(Decimal("9.99"), "USD", locale="de") == "9,99\xa0$"
+        assert format_prices([Money("9.99", "USD")], locale="pl-pl") == ["9,99\xa0USD"]
+
+
+def test_use_locale_overrides_active_language():
+    with translation.override("en"):
+        with locale_utils.use_locale("de"):
+            assert format_price(Decimal("9.99"), "USD") == "9,99\xa0$"
+            assert format_price(Decimal("9.99"), "USD", locale="en") == "$9.99"
+        assert format_price(Decimal("9.99"), "USD") == "$9.99"
+
+
+def test_use_locale_is_isolated_between_threads():
+    results = {}
+
+    def worker(language):
+        with locale_utils.use_locale(language):
+            barrier.wait()
+            results[language] = format_price(Decimal("9.99"), "EUR")
+
+    barrier = threading.Barrier(2)
+    threads = [threading.Thread(target=worker, args=(lang,)) for lang in ("de", "en")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {"de": "9,99\xa0\u20ac", "en": "\u20ac9.99"}
+
+
+def test_use_locale_is_isolated_between_tasks():
+    async def worker(language):
+        with locale_utils.use_locale(language):
+            await asyncio.sleep(0)
+            return format_price(Decimal("9.99"), "EUR")
+
+    async def main():
+        return await asyncio.gather(worker("de"), worker("en"))
+
+    assert asyncio.run(main()) == ["9,99\xa0\u20ac", "\u20ac9.99"]
+
+
+def test_locale_cache_is_bounded(monkeypatch, settings):
+    locale_utils.clear_locale_cache()
+    settings.LANGUAGE_CODE = "en_US"
+    monkeypatch.setattr(locale_utils, "LOCALE_CACHE_SIZE", 2)
+    for language in ["de", "pl", "xx-1", "xx-2", "xx-3"]:
+        locale_utils.get_locale_data(language)
+    assert len(locale_utils._locale_cache) == 2
+    assert locale_utils.get_locale_data("xx-4")[1] == "en_US"
+    assert locale_utils.get_locale_data("de")[1] == "de"
+
+
+def test_nan_is_not_memoized():
+    clear_output_cache()
+    for _ in range(3):
+        format_price(Decimal("NaN"), "USD")
+    assert get_output_cache().cache_info().currsize == 0
@@ -5,6 +5,7 @@ from django_prices.validators import (
     MaxMoneyValidator,
     MinMoneyValidator,
     MoneyPrecisionValidator,
+    validate_money_batch,
 )
 from prices import Money
 
@@ -59,3 +60,77 @@ def test_validate_money_precision_fictional_currency():
     validator(Money("5.1234567890", "BTC"))
     with pytest.raises(ValidationError):
         validator(Money("5.12345678901", "BTC"))
+
+
+def test_validate_money_batch_reports_row_indexes():
+    values = [
+        Money("10.00", "USD"),
+        Money("10.001", "USD"),
+        Money("20", "USD"),
+        Money("1", "USD"),
+        None,
+        Money("1234567.5", "BTC"),
+        Money("30", "BTC"),
+    ]
+    report = validate_money_batch(
+        values,
+        max_digits=9,
+        decimal_places=3,
+        min_values=[Money(5, "USD")],
+        max_values=[Money(15, "USD"), Money(16, "BTC")],
+    )
+    assert not report.is_valid
+    assert [(error.index, error.code) for error in report] == [
+        (1, "max_decimal_places"),
+        (2, "max_value"),
+        (3, "min_value"),
+        (5, "max_whole_digits"),
+        (5, "max_value"),
+        (6, "max_value"),
+    ]
+    assert report.invalid_indexes == [1, 2, 3, 5, 6]
+
+
+def test_validate_money_batch_uses_strictest_limit_per_currency():
+    report = validate_money_batch(
+        [Money("12", "USD")], max_values=[Money(15, "USD"), Money(10, "USD")]
+    )
+    assert [error.params["limit_value"] for error in report] == [Money(10, "USD")]
+
+
+def test_validate_money_batch_valid_values():
+    report = validate_money_batch(
+        [Money("5.00", "USD"), Money("5.12345678", "BTC")], max_digits=16
+    )
+    assert report.is_valid
+    assert len(report) == 0
+
+
+def test_validate_money_batch_messages_match_validators():
+    values = [Money("5.001", "USD"), Money("25", "USD"), Money("1", "USD")]
+    report = validate_money_batch(
+        values,
+        max_digits=9,
+        decimal_places=2,
+        min_values=[Money(5, "USD")],
+        max_values=[Money(15, "USD")],
+    )
+    messages = []
+    for validator, value in [
+        (MoneyPrecisionValidator(9, 2), values[0]),
+        (MaxMoneyValidator(Money(15, "USD")), values[1]),
+        (MinMoneyValidator(Money(5, "USD")), values[2]),
+    ]:
+        with pytest.raises(ValidationError) as error:
+            validator(value)
+        messages.append(error.value.messages[0])
+    assert report.messages() == list(zip([0, 1, 2], messages))
+
+
+def test_validate_money_batch_does_not_format_until_asked(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("formatted eagerly")
+
+    monkeypatch.setattr("django_prices.validators.format_price", fail)
+    report = validate_money_batch([Money(20, "USD")], max_values=[Money(15, "USD")])
+    assert report.invalid_indexes == [0]